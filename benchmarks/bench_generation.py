@@ -0,0 +1,90 @@
+"""End-to-end generation benchmark.
+
+Generates projects against a local wheelhouse and reports cold and warm
+timings as JSON:
+
+- cold: empty venv cache, so the venv is built and installed from the wheelhouse
+- warm: the venv cache is populated by the cold run and cloned into the project
+
+Usage:
+    python benchmarks/bench_generation.py --runs 3 --output bench.json
+
+Fill the wheelhouse once with a normal run of the tool (or pass --wheelhouse)
+so the benchmark never touches the network.
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "flask_automator.py")
+DEFAULT_WHEELHOUSE = os.path.join(
+    os.environ.get("FLASK_AUTOMATOR_CACHE", os.path.join(os.path.expanduser("~"), ".flask_automator")),
+    "wheelhouse"
+)
+
+def generate(name, workdir, cache_dir, git):
+    """Generate one project in a fresh process and return its timing report."""
+    command = [sys.executable, SCRIPT, "create", name, "--path", workdir]
+    if not git:
+        command.append("--no-git")
+    env = {**os.environ, "FLASK_AUTOMATOR_CACHE": cache_dir}
+    subprocess.run(command, env=env, check=True, capture_output=True)
+    with open(os.path.join(workdir, name, ".flask_automator", "timings.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+def summarize(reports):
+    """Median total, step and phase durations over several runs."""
+    def median_of(key):
+        names = sorted({name for report in reports for name in report[key]})
+        return {name: statistics.median(report[key].get(name, 0.0) for report in reports) for name in names}
+    return {
+        "runs": len(reports),
+        "elapsed": [report["elapsed"] for report in reports],
+        "median_elapsed": statistics.median(report["elapsed"] for report in reports),
+        "critical_path": reports[-1]["critical_path"],
+        "steps": median_of("steps"),
+        "phases": median_of("phases")
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="runs per scenario")
+    parser.add_argument("--wheelhouse", default=DEFAULT_WHEELHOUSE, help="pre-filled wheelhouse to install from")
+    parser.add_argument("--git", action="store_true", help="include git init and the initial commit")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.wheelhouse) or not os.listdir(args.wheelhouse):
+        parser.error(f"wheelhouse {args.wheelhouse} is empty, run the tool once to fill it")
+
+    results = {"wheelhouse": args.wheelhouse, "python": sys.version.split()[0]}
+    workdir = tempfile.mkdtemp(prefix="flask-automator-bench-")
+    try:
+        cold, warm = [], []
+        for run in range(args.runs):
+            # A fresh cache per cold run, sharing only the wheelhouse
+            cache_dir = os.path.join(workdir, f"cache-{run}")
+            os.makedirs(cache_dir)
+            shutil.copytree(args.wheelhouse, os.path.join(cache_dir, "wheelhouse"))
+            cold.append(generate(f"cold_{run}", workdir, cache_dir, args.git))
+            warm.append(generate(f"warm_{run}", workdir, cache_dir, args.git))
+        results["cold"] = summarize(cold)
+        results["warm"] = summarize(warm)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
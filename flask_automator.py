@@ -1,11 +1,21 @@
-import os
-import subprocess
-import customtkinter as ctk
-from tkinter import filedialog, messagebox
 import time
-import webbrowser
+_STARTED = time.perf_counter()  # reference point for --startup-time
+
+# Only lightweight modules are imported here; subprocess, webbrowser, hashlib,
+# zipfile, PIL and the GUI toolkit are imported where they are first used
+import os
+import re
+import shutil
+import json
+import sys
+import argparse
+import contextlib
+import collections
 import threading
-from PIL import Image, ImageTk
+import queue
+import string
+import functools
+import textwrap
 
 # Constants
 DEPENDENCIES = [
@@ -15,6 +25,8 @@ DEPENDENCIES = [
 
 FOLDER_STRUCTURE = {
     "backend/models": [],
+    "backend/models/__init__.py": "models_init_py",
+    "backend/models/user.py": "user_model_py",
     "backend/routes": [],
     "backend/utils": [],
     "backend/instances.py": "instances_py",
@@ -28,18 +40,29 @@ FOLDER_STRUCTURE = {
     "frontend/static/js/script.js": "",
     "frontend/static/uploads": [],
     "requirements.txt": "",
-    "README.md": "# Project README\n",
+    "README.md": "readme_md",
     ".env": "SECRET_KEY=your_secret_key\n",
+    ".gitignore": "venv/\n__pycache__/\n*.py[cod]\n.env\ninstance/\n*.db\n.flask_automator/\n"
+                  "frontend/static/css/tailwind.css\nfrontend/static/dist/\n",
     "run.py": "from backend import app\n\nif __name__ == '__main__':\n    app.run(debug=True)"
 }
 
+# Files rewritten by later generation steps; scaffolding only creates them when missing,
+# the steps that write them check the manifest themselves
+STEP_OUTPUTS = {"requirements.txt"}
+
+# Records what was generated so re-runs only touch files the templates changed
+GENERATION_MANIFEST = os.path.join(".flask_automator", "manifest.json")
+# Hashed lock for the generator's own installs; requirements.txt gets the portable pins
+PROJECT_LOCKFILE = os.path.join(".flask_automator", "requirements.lock")
+
 TEMPLATES = {
     "html_base": """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
-<title>{% block title %}My App{% endblock %}</title>
-<link href="https://cdn.jsdelivr.net/npm/tailwindcss/dist/tailwind.min.css" rel="stylesheet">
+<title>{% block title %}%%{project_title}{% endblock %}</title>
+%%{head_assets}
 </head>
 <body>
 {% block content %}{% endblock %}
@@ -56,44 +79,42 @@ login_manager = LoginManager()
     "init_py": """from flask import Flask
 from flask_cors import CORS
 from .instances import db, migrate, login_manager
+from .database import configure_database
 import os
 app = Flask(__name__,
 static_folder='../frontend/static',
 template_folder='../frontend/templates')
 # Load config
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'default-dev-key')
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///app.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+configure_database(app)
 # Initialize extensions
 db.init_app(app)
 migrate.init_app(app, db)
 login_manager.init_app(app)
 login_manager.login_view = 'auth.login'
-@login_manager.user_loader
-def load_user(user_id):
-    try:
-        return None
-        #return User.query.get(user_id)
-    except Exception:
-        return None
+# Importing the models also registers the user loader
+from . import models
 # Enable CORS
 CORS(app)
 # Register blueprints
 from .routes.main import main_bp
 app.register_blueprint(main_bp)
-""",
+%%{app_setup}""",
     "main_routes": """from flask import Blueprint, render_template
 main_bp = Blueprint('main', __name__)
 @main_bp.route('/')
 def index():
     return render_template('main/index.html')
+@main_bp.route('/health')
+def health():
+    return {'status': 'ok'}
 """,
     "index_html": """{% extends "base.html" %}
 {% block title %}Welcome{% endblock %}
 {% block content %}
 <div class="container mx-auto px-4 py-8">
     <div class="text-center">
-        <h1 class="text-4xl font-bold text-blue-600 mb-4">Welcome to Your Flask App</h1>
+        <h1 class="text-4xl font-bold text-blue-600 mb-4">Welcome to %%{project_title}</h1>
         <p class="text-xl text-gray-700 mb-8">Your application is running successfully!</p>
         <div class="bg-gray-100 p-6 rounded-lg shadow-md inline-block">
             <p class="text-left text-gray-800">
@@ -108,161 +129,2343 @@ def index():
     </div>
 </div>
 {% endblock %}
+""",
+    "readme_md": """# %%{project_title}
+""",
+    "init_api_py": """from flask import Flask
+from flask_cors import CORS
+from .instances import db, migrate, login_manager
+from .database import configure_database
+import os
+app = Flask(__name__)
+# Load config
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'default-dev-key')
+configure_database(app)
+# Initialize extensions
+db.init_app(app)
+migrate.init_app(app, db)
+login_manager.init_app(app)
+# Importing the models also registers the user loader
+from . import models
+# Enable CORS
+CORS(app)
+# Register blueprints
+from .routes.api import api_bp
+app.register_blueprint(api_bp)
+%%{app_setup}""",
+    "api_routes": """from flask import Blueprint
+api_bp = Blueprint('api', __name__)
+@api_bp.route('/api/')
+def index():
+    return {'service': '%%{project_name}', 'status': 'ok'}
+@api_bp.route('/health')
+def health():
+    return {'status': 'ok'}
+""",
+    "worker_instances_py": """from flask_sqlalchemy import SQLAlchemy
+from flask_migrate import Migrate
+# Singleton instances
+db = SQLAlchemy()
+migrate = Migrate()
+""",
+    "init_worker_py": """from flask import Flask
+from .instances import db, migrate
+from .database import configure_database
+import os
+app = Flask(__name__)
+# Load config
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'default-dev-key')
+configure_database(app)
+# Initialize extensions
+db.init_app(app)
+migrate.init_app(app, db)
+""",
+    "worker_jobs": """# Job registry: decorate a function with @job to make it runnable from worker.py
+JOBS = {}
+
+def job(func):
+    JOBS[func.__name__] = func
+    return func
+
+@job
+def hello(name='world'):
+    print(f'Hello, {name}!')
+""",
+    "worker_py": """import sys
+from backend import app
+from backend.jobs import JOBS
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in JOBS:
+        print('Usage: python worker.py <job> [args...]')
+        print('Jobs: ' + ', '.join(sorted(JOBS)))
+        sys.exit(1)
+    with app.app_context():
+        JOBS[sys.argv[1]](*sys.argv[2:])
+""",
+    "gunicorn_conf": '''# Gunicorn settings for production, sized to the host it starts on:
+#     gunicorn -c gunicorn.conf.py wsgi:app
+# Environment variables override the defaults, e.g. WEB_CONCURRENCY=8.
+import multiprocessing
+import os
+
+def available_cpus():
+    """CPUs this process may use, honouring affinity masks and cgroup (container) limits."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = multiprocessing.cpu_count()
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+cpus = available_cpus()
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+worker_class = os.environ.get('WORKER_CLASS', '%%{worker_class}')
+
+if worker_class == 'gevent':
+    # Patch the standard library before the app is preloaded in the master
+    from gevent import monkey
+    monkey.patch_all()
+    workers = int(os.environ.get('WEB_CONCURRENCY', cpus))
+    worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 1000))
+elif worker_class == 'gthread':
+    workers = int(os.environ.get('WEB_CONCURRENCY', cpus))
+    threads = int(os.environ.get('THREADS', 4))
+else:
+    # Sync workers handle one request at a time: the classic (2 x cores) + 1
+    workers = int(os.environ.get('WEB_CONCURRENCY', cpus * 2 + 1))
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+# Reuse client connections (not used by sync workers)
+keepalive = int(os.environ.get('KEEPALIVE', 5))
+
+# Recycle workers periodically to contain memory growth; the jitter
+# keeps them from all restarting at the same moment
+max_requests = int(os.environ.get('MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('MAX_REQUESTS_JITTER', 100))
+
+timeout = int(os.environ.get('TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GRACEFUL_TIMEOUT', 30))
+
+# Keep worker heartbeat files in memory rather than on a possibly slow disk
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = os.environ.get('ACCESS_LOG', '-')
+errorlog = os.environ.get('ERROR_LOG', '-')
+''',
+    "database_sqlite_py": """import os
+import sqlite3
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+def configure_database(app):
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+@event.listens_for(Engine, 'connect')
+def tune_sqlite(dbapi_connection, connection_record):
+    # Applied to every new SQLite connection
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    # Readers no longer block the writer (and vice versa)
+    cursor.execute('PRAGMA journal_mode=WAL')
+    # Safe with WAL and avoids an fsync on every commit
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    # Wait for a competing writer instead of failing with "database is locked"
+    cursor.execute('PRAGMA busy_timeout=' + os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+""",
+    "database_server_py": """import os
+
+def configure_database(app):
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', '%%{database_url}')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Each process (e.g. each gunicorn worker) gets its own pool of this size
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # Check connections on checkout so ones the server dropped are replaced, not raised
+        'pool_pre_ping': True,
+        # Recycle before typical server/proxy idle timeouts close the connection
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+""",
+    "models_init_py": """from .user import User
+""",
+    "user_model_py": """from flask_login import UserMixin
+from ..instances import db, login_manager
+
+class User(UserMixin, db.Model):
+    __tablename__ = 'users'
+    id = db.Column(db.Integer, primary_key=True)
+    # Unique indexes back the login lookups
+    email = db.Column(db.String(255), nullable=False, unique=True, index=True)
+    username = db.Column(db.String(80), nullable=False, unique=True, index=True)
+    password_hash = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now(), index=True)
+
+@login_manager.user_loader
+def load_user(user_id):
+    # Flask-Login calls this once per request; Session.get also checks the
+    # identity map first, so a user already loaded in this session is not queried again
+    try:
+        return db.session.get(User, int(user_id))
+    except (TypeError, ValueError):
+        return None
+""",
+    "wsgi_py": """# WSGI entry point for production servers: gunicorn -c gunicorn.conf.py wsgi:app
+from backend import app
+""",
+    "init_factory_py": """import os
+from flask import Flask
+from flask_cors import CORS
+from .instances import db, migrate, login_manager
+from .database import configure_database
+# Importing the models also registers the user loader
+from . import models
+# Everything heavy is imported here, once. With gunicorn's preload_app the master
+# imports it before forking, so the workers share these modules copy-on-write.
+
+def create_app(config=None):
+    app = Flask(%%{factory_app_args})
+    # Load config; values passed in (e.g. by tests) win over the environment
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'default-dev-key')
+    configure_database(app)
+    if config:
+        app.config.update(config)
+    # Initialize extensions
+    db.init_app(app)
+    migrate.init_app(app, db)
+    login_manager.init_app(app)
+    login_manager.login_view = %%{factory_login_view}
+    # Enable CORS
+    CORS(app)
+    register_blueprints(app)
+%%{app_setup}    return app
+
+def register_blueprints(app):
+    # Imported on first use so importing the package has no side effects
+    from .routes.%%{factory_blueprint} import %%{factory_blueprint}_bp
+    app.register_blueprint(%%{factory_blueprint}_bp)
+""",
+    "run_factory_py": """from backend import create_app
+
+app = create_app()
+
+if __name__ == '__main__':
+    app.run(debug=True)
+""",
+    "run_reloader_py": '''import os
+import sys
+import fnmatch
+import signal
+import threading
+import subprocess
+
+from dotenv import load_dotenv
+
+# Loaded before the app is imported, so config read at import time sees it too
+load_dotenv()
+
+%%{app_import}
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# The dev reloader only watches these, never venv/ or the installed packages.
+# Comma-separated; patterns match paths relative to the project root.
+RELOAD_DIRS = os.environ.get('RELOAD_DIRS', 'backend,frontend')
+RELOAD_INCLUDE = os.environ.get('RELOAD_INCLUDE', '*.py,*.html')
+RELOAD_EXCLUDE = os.environ.get('RELOAD_EXCLUDE', '*/__pycache__/*,*/static/dist/*')
+
+def split_patterns(value):
+    return [pattern.strip() for pattern in value.split(',') if pattern.strip()]
+
+def watch():
+    """Serve from a child process and restart it when a watched file changes.
+
+    watchdog gets change notifications from the OS, so an idle server costs
+    no CPU and a restart starts as soon as the file is saved.
+    """
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    include, exclude = split_patterns(RELOAD_INCLUDE), split_patterns(RELOAD_EXCLUDE)
+    changes = []
+    changed = threading.Event()
+
+    def watched(path):
+        path = os.path.relpath(os.fsdecode(path), ROOT).replace(os.sep, '/')
+        return (
+            any(fnmatch.fnmatch(path, pattern) for pattern in include)
+            and not any(fnmatch.fnmatch(path, pattern) for pattern in exclude)
+        )
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Reads show up as opened/closed events on some platforms
+            if event.is_directory or event.event_type not in ('created', 'modified', 'moved', 'deleted'):
+                return
+            for path in (event.src_path, getattr(event, 'dest_path', '')):
+                if path and watched(path):
+                    changes.append(path)
+                    changed.set()
+
+    observer = Observer()
+    for directory in split_patterns(RELOAD_DIRS):
+        directory = os.path.join(ROOT, directory)
+        if os.path.isdir(directory):
+            observer.schedule(Handler(), directory, recursive=True)
+    observer.start()
+
+    child = None
+    try:
+        while True:
+            child = subprocess.Popen([sys.executable, *sys.argv], env={**os.environ, 'RELOADER_CHILD': '1'})
+            changed.wait()
+            changed.clear()
+            # Editors often write a file in several steps; restart once they settle
+            while changed.wait(0.2):
+                changed.clear()
+            print(f" * Detected change in {changes[-1]!r}, reloading", flush=True)
+            changes.clear()
+            stop(child)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observer.stop()
+        if child is not None:
+            stop(child)
+
+def stop(child):
+    child.terminate()
+    try:
+        child.wait(5)
+    except subprocess.TimeoutExpired:
+        child.kill()
+        child.wait()
+
+if __name__ == '__main__':
+    if os.environ.get('RELOADER_CHILD'):
+        app.run(debug=True, use_reloader=False)
+    else:
+        try:
+            import watchdog  # noqa: F401
+        except ImportError:
+            # Werkzeug's polling reloader, kept away from the installed packages
+            exclude = [os.path.join(sys.prefix, '*')]
+            exclude += [os.path.join(ROOT, pattern) for pattern in split_patterns(RELOAD_EXCLUDE)]
+            app.run(debug=True, exclude_patterns=exclude)
+        else:
+            # Stop the server too when the watcher itself is terminated
+            signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+            watch()
+''',
+    "reloader_env": """
+# Dev reloader for python run.py: comma-separated directories and path patterns
+RELOAD_DIRS=backend,frontend
+RELOAD_INCLUDE=*.py,*.html
+RELOAD_EXCLUDE=*/__pycache__/*,*/static/dist/*
+""",
+    "wsgi_factory_py": """# WSGI entry point for production servers: gunicorn -c gunicorn.conf.py wsgi:app
+from backend import create_app
+
+app = create_app()
+""",
+    "conftest_py": """import pytest
+from backend import create_app
+from backend.instances import db
+
+@pytest.fixture(scope='session')
+def app():
+    # Building the app is the expensive part, so the whole session shares one
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+    })
+    with app.app_context():
+        db.create_all()
+    return app
+
+@pytest.fixture(autouse=True)
+def app_context(app):
+    # A fresh context per test, so flask.g, the logged-in user and uncommitted
+    # rows never carry over into the next test
+    with app.app_context() as context:
+        yield context
+        db.session.rollback()
+        db.session.remove()
+
+@pytest.fixture()
+def client(app, app_context):
+    return app.test_client()
+""",
+    "test_health_py": """def test_health(client):
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.get_json() == {'status': 'ok'}
+""",
+    "json_api_setup": """# JSON API: fast JSON provider, keyset pagination and NDJSON streaming
+from .utils.json_api import json_api_bp
+from .routes.users_api import users_api_bp
+app.register_blueprint(json_api_bp)
+app.register_blueprint(users_api_bp)
+""",
+    "json_api_py": '''"""JSON API helpers: a faster JSON provider, keyset pagination and NDJSON streaming."""
+from flask import Blueprint, Response, current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from ..instances import db
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    # Types orjson does not know (Decimal, objects with __html__, ...) go through Flask's default()
+    options = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError('jsonify() behavior undefined when passed both args and kwargs')
+        obj = args[0] if len(args) == 1 else (args or kwargs)
+        option = self.options | orjson.OPT_APPEND_NEWLINE
+        if self._app.debug:
+            option |= orjson.OPT_INDENT_2
+        # Encoded straight to bytes, without the str round trip
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype)
+
+# Registering this blueprint switches the app to orjson when it is installed;
+# otherwise the standard library provider stays in place
+json_api_bp = Blueprint('json_api', __name__)
+
+@json_api_bp.record_once
+def use_fast_json(state):
+    if orjson is not None:
+        state.app.json = OrjsonProvider(state.app)
+
+def keyset_page(query, column, after=None, limit=50):
+    """One page of a select() ordered by a unique, indexed column.
+
+    Returns (rows, next_key); pass next_key back as after for the next page
+    (None means this was the last one). Unlike OFFSET, the database seeks
+    straight to the key, so page 1000 costs the same as page 1.
+    """
+    if after is not None:
+        query = query.where(column > after)
+    rows = db.session.execute(query.order_by(column).limit(limit + 1)).scalars().all()
+    next_key = getattr(rows[limit - 1], column.key) if len(rows) > limit else None
+    return rows[:limit], next_key
+
+def stream_ndjson(rows, serialize=lambda row: row):
+    """Stream rows as newline-delimited JSON, serializing one row at a time.
+
+    rows is an iterable or a function returning one. Pass a function for
+    database results: it runs while the response streams, after the view's
+    own session has been closed.
+    """
+    def generate():
+        for row in rows() if callable(rows) else rows:
+            yield current_app.json.dumps(serialize(row)) + '\\n'
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def stream_query(query, serialize, batch_size=1000):
+    """Stream the rows of a select() as NDJSON, fetching batch_size rows at a time."""
+    return stream_ndjson(
+        lambda: db.session.execute(query.execution_options(yield_per=batch_size)).scalars(),
+        serialize
+    )
+''',
+    "users_api_py": """from flask import Blueprint, request
+from sqlalchemy import select
+from ..models import User
+from ..utils.json_api import keyset_page, stream_query
+
+users_api_bp = Blueprint('users_api', __name__, url_prefix='/api/users')
+
+def serialize_user(user):
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'created_at': user.created_at.isoformat() if user.created_at else None,
+    }
+
+@users_api_bp.get('/')
+def list_users():
+    # GET /api/users/?after=<next from the previous page>&limit=50
+    after = request.args.get('after', type=int)
+    limit = max(1, min(request.args.get('limit', 50, type=int), 500))
+    users, next_key = keyset_page(select(User), User.id, after, limit)
+    return {'items': [serialize_user(user) for user in users], 'next': next_key}
+
+@users_api_bp.get('/export')
+def export_users():
+    # Rows are fetched in batches as the response is written, never all at once
+    return stream_query(select(User).order_by(User.id), serialize_user)
+""",
+    "assets_setup": """# Fingerprinted, precompressed static files built by tools/build_assets.py
+from .assets import init_assets
+init_assets(app)
+""",
+    "assets_py": """import os
+import json
+import mimetypes
+from flask import Blueprint, current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+# Fingerprinted names change whenever the content does, so browsers may keep them for good
+ONE_YEAR = 365 * 24 * 60 * 60
+# Precompressed variants written by the build, best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+# Used while a file has neither been built nor vendored, e.g. Tailwind before the first build
+CDN_FALLBACKS = {'css/tailwind.css': '%%{tailwind_url}'}
+
+assets_bp = Blueprint('assets', __name__)
+
+def init_assets(app):
+    # Read the manifest once at startup rather than on every asset_url() call
+    try:
+        with open(os.path.join(app.static_folder, 'dist', 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        # Not built yet: asset_url() falls back to the plain static files
+        manifest = {}
+    app.extensions['assets'] = manifest
+    app.extensions['asset_fallbacks'] = {
+        path: url for path, url in CDN_FALLBACKS.items()
+        if path not in manifest and not os.path.isfile(os.path.join(app.static_folder, path))
+    }
+    app.register_blueprint(assets_bp)
+    app.add_template_global(asset_url)
+
+def asset_url(path):
+    hashed = current_app.extensions['assets'].get(path)
+    if hashed is not None:
+        return url_for('assets.asset', filename=hashed)
+    fallback = current_app.extensions['asset_fallbacks'].get(path)
+    return fallback or url_for('static', filename=path)
+
+@assets_bp.route('/assets/<path:filename>')
+def asset(filename):
+    dist = os.path.join(current_app.static_folder, 'dist')
+    for encoding, suffix in ENCODINGS:
+        compressed = safe_join(dist, filename + suffix)
+        if encoding in request.accept_encodings and compressed and os.path.isfile(compressed):
+            mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            response = send_from_directory(dist, filename + suffix, mimetype=mimetype, max_age=ONE_YEAR)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(dist, filename, max_age=ONE_YEAR)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.vary.add('Accept-Encoding')
+    return response
+""",
+    "build_assets_py": r'''"""Build the static assets; needs only the standard library, so it runs offline.
+
+    python tools/build_assets.py
+
+1. Purges frontend/assets/tailwind.css down to the classes the templates,
+   scripts and backend code mention and writes frontend/static/css/tailwind.css.
+2. Copies every static file to frontend/static/dist/ under a content-hashed
+   name and records the mapping in frontend/static/dist/manifest.json.
+3. Writes a .gz (and a .br when the brotli package is installed) next to
+   each compressible file so the server never compresses on the fly.
+
+Run it again whenever templates or static files change.
 """
+import os
+import re
+import gzip
+import json
+import shutil
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRONTEND = os.path.join(ROOT, 'frontend')
+STATIC = os.path.join(FRONTEND, 'static')
+DIST = os.path.join(STATIC, 'dist')
+TAILWIND_SOURCE = os.path.join(FRONTEND, 'assets', 'tailwind.css')
+TAILWIND_OUTPUT = os.path.join(STATIC, 'css', 'tailwind.css')
+
+# Where class names can appear
+CONTENT_DIRS = [os.path.join(FRONTEND, 'templates'), os.path.join(STATIC, 'js'), os.path.join(ROOT, 'backend')]
+CONTENT_EXTENSIONS = ('.html', '.js', '.py')
+# Static directories that are not build inputs
+SKIP_DIRS = {'dist', 'uploads'}
+COMPRESSIBLE = ('.css', '.js', '.svg', '.json', '.txt', '.html', '.xml', '.map')
+
+# Same idea as Tailwind's own purge: any run of characters that could be a class name
+TOKEN_RE = re.compile(r'[^<>"\'`\s]*[^<>"\'`\s:]')
+CLASS_RE = re.compile(r'\.((?:\\.|[\w-])+)')
+ESCAPE_RE = re.compile(r'\\([0-9a-fA-F]{1,6}) ?|\\(.)')
+
+def used_tokens():
+    tokens = set()
+    for content_dir in CONTENT_DIRS:
+        for dirpath, _, filenames in os.walk(content_dir):
+            for filename in filenames:
+                if filename.endswith(CONTENT_EXTENSIONS):
+                    with open(os.path.join(dirpath, filename), encoding='utf-8', errors='ignore') as f:
+                        tokens.update(TOKEN_RE.findall(f.read()))
+    return tokens
+
+def unescape(name):
+    # .md\:flex -> md:flex, .\32xl\:p-4 -> 2xl:p-4
+    return ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)) if m.group(1) else m.group(2), name)
+
+def parse_blocks(css):
+    """Split CSS into top-level (prelude, body) pairs; body is None for at-rule statements."""
+    blocks, depth, start, body_start, quote = [], 0, 0, 0, None
+    for i, ch in enumerate(css):
+        if quote:
+            if ch == quote and css[i - 1] != '\\':
+                quote = None
+        elif ch in '"\'':
+            quote = ch
+        elif ch == '{':
+            if depth == 0:
+                prelude, body_start = css[start:i].strip(), i + 1
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[body_start:i]))
+                start = i + 1
+        elif ch == ';' and depth == 0:
+            blocks.append((css[start:i].strip(), None))
+            start = i + 1
+    return blocks
+
+def split_selectors(prelude):
+    selectors, depth, start = [], 0, 0
+    for i, ch in enumerate(prelude):
+        if ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+def purge(css, tokens):
+    """Drop every rule whose selectors need a class that no template uses."""
+    out = []
+    for prelude, body in parse_blocks(css):
+        if body is None:
+            out.append(prelude + ';')
+        elif prelude.startswith(('@media', '@supports')):
+            inner = purge(body, tokens)
+            if inner:
+                out.append(prelude + '{' + inner + '}')
+        elif prelude.startswith('@'):
+            # @keyframes, @font-face and friends are small and referenced by name
+            out.append(prelude + '{' + body + '}')
+        else:
+            selectors = [
+                selector for selector in split_selectors(prelude)
+                if all(unescape(name) in tokens for name in CLASS_RE.findall(selector))
+            ]
+            if selectors:
+                out.append(','.join(selectors) + '{' + body + '}')
+    return ''.join(out)
+
+def build_tailwind():
+    if not os.path.isfile(TAILWIND_SOURCE):
+        print(f'Skipping Tailwind: {os.path.relpath(TAILWIND_SOURCE, ROOT)} not found')
+        return
+    with open(TAILWIND_SOURCE, encoding='utf-8') as f:
+        source = f.read()
+    css = purge(re.sub(r'/\*.*?\*/', '', source, flags=re.S), used_tokens())
+    os.makedirs(os.path.dirname(TAILWIND_OUTPUT), exist_ok=True)
+    with open(TAILWIND_OUTPUT, 'w', encoding='utf-8') as f:
+        f.write(css)
+    print(f'tailwind.css: {len(source):,} -> {len(css):,} bytes')
+
+def precompress(path, data):
+    # Only keep a compressed copy when it actually saves bytes
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    for suffix, compressed in variants:
+        if len(compressed) < len(data):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+
+def fingerprint(target_dir):
+    manifest = {}
+    for dirpath, dirnames, filenames in os.walk(STATIC):
+        if dirpath == STATIC:
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS and not name.startswith('dist.')]
+        for filename in filenames:
+            source = os.path.join(dirpath, filename)
+            logical = os.path.relpath(source, STATIC).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                data = f.read()
+            stem, ext = os.path.splitext(logical)
+            hashed = f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}'
+            target = os.path.join(target_dir, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(data)
+            if ext.lower() in COMPRESSIBLE:
+                precompress(target, data)
+            manifest[logical] = hashed
+    with open(os.path.join(target_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+def main():
+    build_tailwind()
+    # Build next to the old output and swap it in, so a failed build leaves the last one intact
+    staging = DIST + '.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    manifest = fingerprint(staging)
+    shutil.rmtree(DIST, ignore_errors=True)
+    os.rename(staging, DIST)
+    print(f'{len(manifest)} files fingerprinted into {os.path.relpath(DIST, ROOT)}'
+          + ('' if brotli else ' (gzip only, pip install brotli for .br files)'))
+
+if __name__ == '__main__':
+    main()
+''',
+    "instrumentation_setup": """# Request timing, query counting and profiling, switched on by environment variables
+from .instrumentation import init_instrumentation
+init_instrumentation(app)
+""",
+    "instrumentation_py": '''"""Request instrumentation, switched off unless these environment variables are set:
+
+INSTRUMENT=1              Server-Timing header, SQL query count and time per request,
+                          N+1 warnings and the slow-request log
+SLOW_REQUEST_MS=500       log requests slower than this
+N_PLUS_ONE_THRESHOLD=5    warn when one statement runs this many times in a request
+PROFILE=1                 cProfile every request and dump one .prof file per request
+PROFILE_DIR=...           where to dump them (default: instance/profiles)
+
+With neither INSTRUMENT nor PROFILE set, init_instrumentation() registers
+nothing, so requests run exactly as if this module did not exist.
+"""
+import os
+import time
+from flask import g, has_request_context, request
+
+def _enabled(name):
+    return os.environ.get(name, '').lower() in ('1', 'true', 'yes', 'on')
+
+def init_instrumentation(app):
+    if _enabled('PROFILE'):
+        _init_profiler(app)
+    if _enabled('INSTRUMENT'):
+        _init_timing(app)
+
+def _init_profiler(app):
+    from werkzeug.exceptions import HTTPException
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    profile_dir = os.environ.get('PROFILE_DIR', os.path.join(app.instance_path, 'profiles'))
+    os.makedirs(profile_dir, exist_ok=True)
+
+    # Name files after the endpoint so all profiles of one view sort together
+    def filename(environ):
+        try:
+            endpoint, _ = app.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            endpoint = 'unmatched'
+        elapsed = environ.get('werkzeug.profiler', {}).get('elapsed', 0)
+        return f'{endpoint}.{elapsed:.0f}ms.{time.time_ns() // 1000}.prof'
+
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, stream=None, profile_dir=profile_dir, filename_format=filename)
+    app.logger.warning('Profiling every request into %s', profile_dir)
+
+def _init_timing(app):
+    slow_ms = float(os.environ.get('SLOW_REQUEST_MS', 500))
+    n_plus_one = int(os.environ.get('N_PLUS_ONE_THRESHOLD', 5))
+    try:
+        _init_query_counter()
+    except ImportError:
+        pass  # no SQLAlchemy in this app: time requests only
+
+    @app.before_request
+    def start_request_timer():
+        g.instrumentation = {'start': time.perf_counter(), 'queries': 0, 'query_time': 0.0, 'statements': {}}
+
+    @app.after_request
+    def report_request_timing(response):
+        stats = g.pop('instrumentation', None)
+        if stats is None:
+            return response
+        total_ms = (time.perf_counter() - stats['start']) * 1000
+        db_ms = stats['query_time'] * 1000
+        response.headers['Server-Timing'] = (
+            f'app;dur={total_ms - db_ms:.1f}, '
+            f'db;dur={db_ms:.1f};desc="{stats["queries"]} queries", '
+            f'total;dur={total_ms:.1f}'
+        )
+        for statement, count in stats['statements'].items():
+            if count >= n_plus_one:
+                app.logger.warning('Possible N+1 in %s %s: %d x %s', request.method, request.path, count, statement[:200])
+        if total_ms >= slow_ms:
+            app.logger.warning(
+                'Slow request %s %s: %.0f ms (%d queries, %.0f ms in SQL)',
+                request.method, request.path, total_ms, stats['queries'], db_ms
+            )
+        return response
+
+def _init_query_counter():
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    # SQLAlchemy listeners are global: register them once however many apps are created
+    if not event.contains(Engine, 'after_cursor_execute', _count_query):
+        event.listen(Engine, 'before_cursor_execute', _start_query_timer)
+        event.listen(Engine, 'after_cursor_execute', _count_query)
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    stats = g.get('instrumentation') if has_request_context() else None
+    if stats is None:
+        return
+    stats['queries'] += 1
+    stats['query_time'] += elapsed
+    # Lazy loads repeat the same parameterized statement once per parent row
+    stats['statements'][statement] = stats['statements'].get(statement, 0) + 1
+''',
+    "bench_loadgen_py": '''"""Closed-loop HTTP load generator using only the standard library.
+
+    python -m bench.loadgen http://127.0.0.1:5000/health --concurrency 16 --duration 10
+
+Each thread keeps a persistent connection and sends its next request as soon
+as the previous response has been read, so the rate reported is what the
+server sustains at that concurrency. Results are printed as JSON.
+"""
+import json
+import math
+import time
+import argparse
+import threading
+import http.client
+from urllib.parse import urlsplit
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)]
+
+def ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+def _worker(host, port, path, deadline, latencies, failures):
+    connection = None
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        reused = connection is not None
+        try:
+            if connection is None:
+                connection = http.client.HTTPConnection(host, port, timeout=10)
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                failures.append(str(response.status))
+            else:
+                latencies.append(time.perf_counter() - start)
+            # HTTP/1.0 servers such as the dev server close after every response
+            if response.will_close:
+                connection.close()
+                connection = None
+        except (OSError, http.client.HTTPException) as e:
+            if connection is not None:
+                connection.close()
+            connection = None
+            # The server closed an idle kept-alive connection (e.g. a recycled worker): retry on a new one
+            if reused and isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)):
+                continue
+            failures.append(type(e).__name__)
+    if connection is not None:
+        connection.close()
+
+def _drive(url, concurrency, duration):
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    deadline = time.perf_counter() + duration
+    # One list per thread, merged afterwards, keeps the hot loop lock-free
+    latencies = [[] for _ in range(concurrency)]
+    failures = [[] for _ in range(concurrency)]
+    threads = [
+        threading.Thread(target=_worker, args=(parts.hostname, parts.port or 80, path, deadline, latencies[i], failures[i]))
+        for i in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return sorted(value for values in latencies for value in values), [f for values in failures for f in values], elapsed
+
+def run_load(url, concurrency=16, duration=10.0, warmup=1.0):
+    """Drive url with concurrency threads for duration seconds and summarize the run."""
+    if warmup:
+        # Let connection pools, caches and lazy imports settle before measuring
+        _drive(url, concurrency, warmup)
+    latencies, failures, elapsed = _drive(url, concurrency, duration)
+    errors = {}
+    for failure in failures:
+        errors[failure] = errors.get(failure, 0) + 1
+    return {
+        'url': url,
+        'concurrency': concurrency,
+        'duration': round(elapsed, 3),
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            'mean': ms(sum(latencies) / len(latencies)) if latencies else None,
+            'p50': ms(percentile(latencies, 50)),
+            'p95': ms(percentile(latencies, 95)),
+            'p99': ms(percentile(latencies, 99)),
+            'max': ms(latencies[-1] if latencies else None),
+        },
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('url', help='URL to request, e.g. http://127.0.0.1:5000/health')
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help='concurrent connections')
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='seconds to measure')
+    parser.add_argument('--warmup', type=float, default=1.0, help='seconds of unmeasured load first')
+    args = parser.parse_args()
+    print(json.dumps(run_load(args.url, args.concurrency, args.duration, args.warmup), indent=2))
+
+if __name__ == '__main__':
+    main()
+''',
+    "bench_compare_py": '''"""Compare the dev server with gunicorn under the same load.
+
+    python -m bench.compare --concurrency 16 --duration 10 --output bench.json
+
+Starts each server on a free localhost port, waits for it to answer, drives
+it with bench.loadgen and stops it again. gunicorn uses gunicorn.conf.py and
+wsgi.py when the project has them. Run it with the project's virtualenv.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import subprocess
+import urllib.request
+from .loadgen import run_load
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST = '127.0.0.1'
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+def server_command(name, port):
+    if name == 'dev':
+        # The Werkzeug server as run.py starts it, minus the debugger and reloader
+        return [sys.executable, '-c', f"from run import app; app.run(host='{HOST}', port={port}, use_reloader=False)"]
+    config = ['-c', 'gunicorn.conf.py'] if os.path.exists(os.path.join(ROOT, 'gunicorn.conf.py')) else []
+    target = 'wsgi:app' if os.path.exists(os.path.join(ROOT, 'wsgi.py')) else 'run:app'
+    # --bind on the command line overrides the config file
+    return [sys.executable, '-m', 'gunicorn', *config, '--bind', f'{HOST}:{port}', target]
+
+def wait_until_ready(process, url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'server exited with code {process.returncode}')
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'server did not answer within {timeout}s')
+
+def benchmark(name, path, concurrency, duration):
+    port = free_port()
+    url = f'http://{HOST}:{port}{path}'
+    # Request logs go nowhere so they do not compete with the load generator for the terminal
+    process = subprocess.Popen(server_command(name, port), cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(process, url)
+        return run_load(url, concurrency, duration)
+    except RuntimeError as e:
+        return {'error': str(e)}
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    # gunicorn does not run on Windows
+    default_servers = ['dev'] if os.name == 'nt' else ['dev', 'gunicorn']
+    parser.add_argument('--servers', nargs='+', choices=['dev', 'gunicorn'], default=default_servers)
+    parser.add_argument('--path', default='/health', help='path to request')
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help='concurrent connections')
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='seconds to measure per server')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    args = parser.parse_args()
+
+    results = {'python': sys.version.split()[0], 'cpus': os.cpu_count()}
+    for name in args.servers:
+        print(f'Benchmarking {name}...', file=sys.stderr)
+        results[name] = benchmark(name, args.path, args.concurrency, args.duration)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
+''',
+}
+
+# Template packs: each declares its file tree (same format as FOLDER_STRUCTURE),
+# the templates it renders, its dependencies and whether it runs a web server.
+# Templates take %%{name} parameters such as %%{project_name} and %%{project_title}.
+API_STRUCTURE = {
+    "backend/models": [],
+    "backend/models/__init__.py": "models_init_py",
+    "backend/models/user.py": "user_model_py",
+    "backend/routes": [],
+    "backend/utils": [],
+    "backend/instances.py": "instances_py",
+    "backend/__init__.py": "init_api_py",
+    "backend/routes/api.py": "api_routes",
+    "requirements.txt": "",
+    "README.md": "readme_md",
+    ".env": "SECRET_KEY=your_secret_key\n",
+    ".gitignore": "venv/\n__pycache__/\n*.py[cod]\n.env\ninstance/\n*.db\n.flask_automator/\n",
+    "run.py": "from backend import app\n\nif __name__ == '__main__':\n    app.run(debug=True)"
+}
+
+WORKER_STRUCTURE = {
+    "backend/models": [],
+    "backend/jobs/__init__.py": "worker_jobs",
+    "backend/instances.py": "worker_instances_py",
+    "backend/__init__.py": "init_worker_py",
+    "requirements.txt": "",
+    "README.md": "readme_md",
+    ".env": "SECRET_KEY=your_secret_key\n",
+    ".gitignore": "venv/\n__pycache__/\n*.py[cod]\n.env\ninstance/\n*.db\n.flask_automator/\n",
+    "worker.py": "worker_py"
+}
+
+TEMPLATE_PACKS = {
+    "full-stack": {
+        "description": "Server-rendered app with Tailwind templates, auth and database",
+        "structure": FOLDER_STRUCTURE
+    },
+    "api": {
+        "description": "JSON API without templates or static files",
+        "structure": API_STRUCTURE,
+        "options": {"json_api": True}
+    },
+    "worker": {
+        "description": "Background job runner sharing the Flask app and database",
+        "structure": WORKER_STRUCTURE,
+        "dependencies": ["flask", "flask-sqlalchemy", "flask-migrate", "python-dotenv"],
+        "launch": False
+    }
+}
+
+# Generation options; the GUI launches the app, headless runs only build the project
+DEFAULT_OPTIONS = {
+    "git": True,          # run git init in the new project
+    "venv_cache": True,   # reuse cached virtual environments
+    "template_pack": "full-stack",
+    "server_profile": "dev",       # "production" adds gunicorn.conf.py and wsgi.py
+    "worker_class": "gthread",     # gunicorn worker: sync, gthread or gevent
+    "database": "sqlite",          # sqlite, postgresql or mysql
+    "assets": True,       # purged, fingerprinted and precompressed static files
+    "bench": True,        # bench/ load generator comparing the dev server and gunicorn
+    "instrumentation": True,  # env-switched Server-Timing, query counting and profiling
+    "app_factory": False,  # create_app() factory with a pytest fixture instead of a global app
+    "json_api": False,    # orjson provider, keyset pagination and NDJSON streaming (on for the api pack)
+    "reloader": True,     # run.py restarts on OS change notifications (watchdog) instead of polling
+    "launch": False,      # start the dev server once the project is built
+    "open_browser": False,
+    "open_editor": False
+}
+
+FLASK_HOST, FLASK_PORT = "127.0.0.1", 5000
+FLASK_URL = f"http://{FLASK_HOST}:{FLASK_PORT}/"
+HEALTH_URL = FLASK_URL + "health"
+SERVER_START_TIMEOUT = 30  # seconds to wait for the dev server to answer
+
+# Persistent cache shared by every generated project (override with FLASK_AUTOMATOR_CACHE)
+CACHE_DIR = os.environ.get(
+    "FLASK_AUTOMATOR_CACHE",
+    os.path.join(os.path.expanduser("~"), ".flask_automator")
+)
+WHEELHOUSE_DIR = os.path.join(CACHE_DIR, "wheelhouse")
+VENV_CACHE_DIR = os.path.join(CACHE_DIR, "venvs")
+LOCKS_DIR = os.path.join(CACHE_DIR, "locks")
+# Size budget for cached environments, least recently used ones are evicted first
+VENV_CACHE_MAX_BYTES = int(os.environ.get("FLASK_AUTOMATOR_VENV_CACHE_MB", "2048")) * 1024 * 1024
+ASSETS_CACHE_DIR = os.path.join(CACHE_DIR, "assets")
+
+# Tailwind is vendored into projects with the asset pipeline so their build works offline
+TAILWIND_VERSION = "2.2.19"
+TAILWIND_URL = f"https://cdn.jsdelivr.net/npm/tailwindcss@{TAILWIND_VERSION}/dist/tailwind.min.css"
+
+class GenerationCancelled(Exception):
+    """Raised inside generation when the user cancels it."""
+
+def canonical_name(name):
+    """Normalize a distribution name so 'Flask_SQLAlchemy' and 'flask-sqlalchemy' compare equal."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+# Seconds each kind of external command may run before it is stopped
+COMMAND_TIMEOUTS = {
+    "git": 60,
+    "venv": 300,
+    "pip": int(os.environ.get("FLASK_AUTOMATOR_PIP_TIMEOUT", "1800")),
+    "assets": 300
+}
+LOG_LINES = 500  # command output lines kept for the log pane and error messages
+TERMINATE_GRACE = 3  # seconds between terminate() and kill() when stopping a command
+
+class CommandError(RuntimeError):
+    """An external command exited with an error or timed out."""
+    
+    def __init__(self, message, output=()):
+        tail = "\n".join(list(output)[-10:])
+        super().__init__(f"{message}\n{tail}" if tail else message)
+        self.output = list(output)
+
+def run_command(args, cwd=None, timeout=None, cancel_event=None, on_line=None, check=True):
+    """Run a command, streaming each line of its combined output to on_line.
+
+    Returns (returncode, last LOG_LINES lines of output). A non-zero exit
+    raises CommandError when check is set; running past timeout always does.
+    Setting cancel_event stops the command within a fraction of a second
+    and raises GenerationCancelled.
+    """
+    import asyncio
+    
+    def signal_group(process, kill):
+        # The command runs in its own process group so helpers it started
+        # (and that may hold the output pipe open) are stopped with it
+        if os.name == 'nt':
+            process.kill() if kill else process.terminate()
+            return
+        import signal
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+    
+    async def stop(process):
+        signal_group(process, kill=False)
+        try:
+            await asyncio.wait_for(process.wait(), TERMINATE_GRACE)
+        except asyncio.TimeoutError:
+            pass
+        signal_group(process, kill=True)
+        await process.wait()
+    
+    async def run():
+        import subprocess
+        process = await asyncio.create_subprocess_exec(
+            *args, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            limit=1024 * 1024, start_new_session=os.name != 'nt'
+        )
+        output = collections.deque(maxlen=LOG_LINES)
+        
+        async def read_output():
+            async for raw in process.stdout:
+                line = raw.decode(errors="replace").rstrip()
+                output.append(line)
+                if on_line:
+                    on_line(line)
+            await process.wait()
+        
+        async def wait_for_cancel():
+            while not cancel_event.is_set():
+                await asyncio.sleep(0.05)
+        
+        reader = asyncio.ensure_future(read_output())
+        watchers = {reader}
+        if cancel_event is not None:
+            watchers.add(asyncio.ensure_future(wait_for_cancel()))
+        try:
+            await asyncio.wait(watchers, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+            if not reader.done():
+                await stop(process)
+        if cancel_event is not None and cancel_event.is_set():
+            raise GenerationCancelled()
+        if not reader.done() or reader.cancelled():
+            raise CommandError(f"{os.path.basename(args[0])} timed out after {timeout}s", output)
+        return process.returncode, list(output)
+    
+    returncode, output = asyncio.run(run())
+    if check and returncode != 0:
+        raise CommandError(f"{os.path.basename(args[0])} exited with code {returncode}", output)
+    return returncode, output
+
+def run_pip(pip_args, dependencies, on_package=None, cancel_event=None, on_line=None):
+    """Run pip, streaming its output and reporting each listed package as pip reaches it.
+
+    on_package(index, name, total) is called once per package in dependencies.
+    Returns pip's exit code; a hung pip is stopped after COMMAND_TIMEOUTS["pip"].
+    """
+    wanted = {canonical_name(dep): dep for dep in dependencies}
+    seen = set()
+    
+    def parse(line):
+        if on_line:
+            on_line(line)
+        # "Collecting flask" when resolving from the index,
+        # "Processing /wheelhouse/flask-3.0.0-py3-none-any.whl" when installing from the wheelhouse
+        match = re.match(r"\s*(?:Collecting|Processing)\s+(?:\S*[/\\])?([A-Za-z0-9_.\-]+?)(?:-\d|[<>=!~\[;\s]|$)", line)
+        if not match:
+            return
+        name = canonical_name(match.group(1))
+        if name in wanted and name not in seen:
+            seen.add(name)
+            if on_package:
+                on_package(len(seen) - 1, wanted[name], len(wanted))
+    
+    returncode, _ = run_command(
+        pip_args + ["--disable-pip-version-check", "--progress-bar", "off"],
+        timeout=COMMAND_TIMEOUTS["pip"], cancel_event=cancel_event, on_line=parse, check=False
+    )
+    return returncode
+
+@contextlib.contextmanager
+def cache_lock(name, stale_after=600):
+    """Hold an exclusive lock on a cache resource across processes."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    lock_path = os.path.join(CACHE_DIR, f"{name}.lock")
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            # Break locks left behind by a crashed process
+            try:
+                if time.time() - os.path.getmtime(lock_path) > stale_after:
+                    os.remove(lock_path)
+            except OSError:
+                pass
+            time.sleep(0.2)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+def fill_wheelhouse(pip_path, dependencies, cancel_event=None, on_line=None):
+    """Download (or build) wheels for the whole dependency tree into the wheelhouse."""
+    # The lock keeps concurrent batch workers from downloading the same wheels
+    with cache_lock("wheelhouse"):
+        fill = [pip_path, "wheel", "--wheel-dir", WHEELHOUSE_DIR] + list(dependencies)
+        if run_pip(fill, dependencies, cancel_event=cancel_event, on_line=on_line) != 0:
+            raise RuntimeError(f"Could not download dependencies into {WHEELHOUSE_DIR}")
+
+def install_dependencies(pip_path, dependencies, on_package=None, cancel_event=None, lockfile=None, on_line=None):
+    """Install all dependencies in a single pip run, backed by the local wheelhouse.
+
+    The first run fills the wheelhouse from the package index; later runs
+    install with --no-index so nothing is downloaded again. With a lockfile
+    pip installs exactly the pinned, hashed wheels and skips resolution.
+    """
+    os.makedirs(WHEELHOUSE_DIR, exist_ok=True)
+    offline = [pip_path, "install", "--no-index", "--find-links", WHEELHOUSE_DIR]
+    if lockfile:
+        # Every locked package shows up in pip's output, so progress covers the whole tree
+        with open(lockfile) as f:
+            locked = [line.split("==")[0] for line in f if "==" in line and not line.startswith("#")]
+        lock_install = offline + ["--no-deps", "--require-hashes", "-r", lockfile]
+        if run_pip(lock_install, locked, on_package, cancel_event, on_line) == 0:
+            return
+    offline_install = offline + list(dependencies)
+    if run_pip(offline_install, dependencies, on_package, cancel_event, on_line) == 0:
+        return
+
+    # Wheelhouse is empty or incomplete: fill it once, then install offline
+    fill_wheelhouse(pip_path, dependencies, cancel_event, on_line)
+    if run_pip(offline_install, dependencies, on_package, cancel_event, on_line) != 0:
+        raise RuntimeError("pip could not install dependencies from the wheelhouse")
+
+def lock_dependencies(pip_path, dependencies, key, cancel_event=None, on_line=None):
+    """Pin the full dependency tree to wheelhouse files and their SHA-256 hashes.
+
+    Resolution runs once per dependency hash with pip's dry-run report; the
+    result is cached in LOCKS_DIR and reused while its wheels are still in
+    the wheelhouse. Returns a list of {"name", "version", "file", "sha256"}.
+    """
+    lock_path = os.path.join(LOCKS_DIR, f"{key}.json")
+    try:
+        with open(lock_path) as f:
+            packages = json.load(f)["packages"]
+        if all(os.path.isfile(os.path.join(WHEELHOUSE_DIR, package["file"])) for package in packages):
+            return packages
+    except (OSError, ValueError, KeyError):
+        pass
+
+    os.makedirs(LOCKS_DIR, exist_ok=True)
+    os.makedirs(WHEELHOUSE_DIR, exist_ok=True)
+    report_path = f"{lock_path}.{os.getpid()}.report"
+    # --ignore-installed so a venv restored from cache still reports every package
+    resolve = [
+        pip_path, "install", "--dry-run", "--ignore-installed", "--quiet", "--report", report_path,
+        "--no-index", "--find-links", WHEELHOUSE_DIR
+    ] + list(dependencies)
+    try:
+        if run_pip(resolve, dependencies, cancel_event=cancel_event, on_line=on_line) != 0:
+            fill_wheelhouse(pip_path, dependencies, cancel_event, on_line)
+            if run_pip(resolve, dependencies, cancel_event=cancel_event, on_line=on_line) != 0:
+                raise RuntimeError("pip could not resolve the dependencies from the wheelhouse")
+        with open(report_path) as f:
+            report = json.load(f)
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(report_path)
+
+    packages = packages_from_report(report)
+    # Write then rename so concurrent batch workers never read a partial lock
+    staging = f"{lock_path}.{os.getpid()}.tmp"
+    with open(staging, "w") as f:
+        json.dump({"dependencies": sorted(dependencies), "packages": packages}, f, indent=2)
+    os.replace(staging, lock_path)
+    return packages
+
+def packages_from_report(report):
+    """Locked packages from a pip --report of an install from the wheelhouse, sorted by name."""
+    import urllib.parse
+    import urllib.request
+    packages = []
+    for item in report["install"]:
+        path = urllib.request.url2pathname(urllib.parse.urlparse(item["download_info"]["url"]).path)
+        packages.append({
+            "name": item["metadata"]["name"],
+            "version": item["metadata"]["version"],
+            "file": os.path.basename(path),
+            # Hash the file itself: pip does not report hashes for --find-links archives
+            "sha256": file_hash(path)
+        })
+    packages.sort(key=lambda package: canonical_name(package["name"]))
+    return packages
+
+def format_lockfile(packages):
+    """Render locked packages as a requirements file that pip installs with --require-hashes.
+
+    The hashes are those of this machine's wheelhouse, so the file only
+    suits the generator's own installs; format_pins() is the portable form.
+    """
+    lines = [
+        "# Pinned with wheelhouse hashes by flask-automator for this platform only:",
+        "#   pip install --no-deps --require-hashes -r .flask_automator/requirements.lock",
+    ]
+    for package in packages:
+        lines.append(f"{package['name']}=={package['version']} \\\n    --hash=sha256:{package['sha256']}")
+    return "\n".join(lines) + "\n"
+
+def format_pins(packages):
+    """Render locked packages as plain name==version pins that install on any platform."""
+    return "".join(f"{package['name']}=={package['version']}\n" for package in packages)
+
+def venv_executables(venv_path):
+    """Return the (pip, python) paths inside a virtual environment for Windows and Linux."""
+    if os.name == 'nt':
+        return os.path.join(venv_path, "Scripts", "pip.exe"), os.path.join(venv_path, "Scripts", "python.exe")
+    return os.path.join(venv_path, "bin", "pip"), os.path.join(venv_path, "bin", "python")
+
+def dependency_hash(python_cmd, dependencies):
+    """Hash the interpreter version and dependency set that a virtual environment is built from."""
+    import hashlib
+    import subprocess
+    interpreter = subprocess.run(
+        [python_cmd, "-c", "import sys, platform; print(sys.version, platform.machine())"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    digest = hashlib.sha256(interpreter.encode())
+    for dep in sorted(canonical_name(dep) for dep in dependencies):
+        digest.update(b"\0" + dep.encode())
+    return digest.hexdigest()[:16]
+
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones (btrfs, xfs)
+
+def _reflink(src, dst):
+    """Create a copy-on-write clone of src at dst, raising OSError where unsupported."""
+    import fcntl
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError:
+            target.close()
+            os.remove(dst)
+            raise
+    shutil.copystat(src, dst)
+
+def clone_tree(source, target, hardlink=True):
+    """Copy a directory tree as cheaply as the filesystem allows.
+
+    Files are cloned copy-on-write where supported, hardlinked (unless
+    hardlink is False) when source and target share a filesystem, and copied
+    otherwise. The first strategy that fails is not retried for the remaining
+    files. Clones and copies are always writable by their owner.
+    """
+    import stat
+    strategies = [os.link, shutil.copy2] if hardlink else [shutil.copy2]
+    if hasattr(os, "uname") and os.uname().sysname == "Linux":
+        strategies.insert(0, _reflink)
+
+    def clone_file(src, dst):
+        while len(strategies) > 1:
+            try:
+                return link_or_copy(strategies[0], src, dst)
+            except OSError:
+                strategies.pop(0)
+        return link_or_copy(strategies[0], src, dst)
+
+    def link_or_copy(strategy, src, dst):
+        strategy(src, dst)
+        # A hardlink shares the source's mode; an independent copy of a read-only cache file need not
+        if strategy is not os.link:
+            mode = os.stat(dst).st_mode
+            if not mode & stat.S_IWUSR:
+                os.chmod(dst, mode | stat.S_IWUSR)
+
+    shutil.copytree(source, target, symlinks=True, copy_function=clone_file)
+
+def make_read_only(path):
+    """Clear the write bits of every regular file under path, leaving directories writable."""
+    import stat
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                mode = os.stat(file_path).st_mode
+                os.chmod(file_path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+def remove_tree(path):
+    """shutil.rmtree that also removes read-only files on Windows, ignoring other errors."""
+    import stat
+
+    def make_writable(func, failed_path, _):
+        try:
+            os.chmod(failed_path, stat.S_IWRITE)
+            func(failed_path)
+        except OSError:
+            pass
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=make_writable)
+    else:
+        shutil.rmtree(path, onerror=make_writable)
+
+def relocate_venv(venv_path, old_prefix, new_prefix):
+    """Rewrite absolute paths in activation scripts, shebangs and pyvenv.cfg after moving a venv."""
+    scripts_dir = os.path.join(venv_path, "Scripts" if os.name == 'nt' else "bin")
+    candidates = [os.path.join(venv_path, "pyvenv.cfg")]
+    candidates += [os.path.join(scripts_dir, name) for name in os.listdir(scripts_dir)]
+    old, new = os.fsencode(old_prefix), os.fsencode(new_prefix)
+    for path in candidates:
+        if os.path.islink(path) or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        if old not in data:
+            continue
+        # Write a new file instead of editing in place: the old one may be linked into the cache
+        tmp_path = path + ".relocate"
+        with open(tmp_path, "wb") as f:
+            f.write(data.replace(old, new))
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+
+def _tree_size(path):
+    """Total size in bytes of the regular files below path."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+    return total
+
+def restore_cached_venv(key, venv_path):
+    """Clone the cached environment for key into venv_path. Returns False on a cache miss."""
+    cached = os.path.join(VENV_CACHE_DIR, key)
+    if not os.path.isdir(cached):
+        return False
+    clone_tree(cached, venv_path)
+    relocate_venv(venv_path, cached, venv_path)
+    # Mark as recently used for eviction
+    os.utime(cached + ".json")
+    return True
+
+def store_cached_venv(key, venv_path):
+    """Save a freshly built environment in the cache and evict old entries over the size budget."""
+    os.makedirs(VENV_CACHE_DIR, exist_ok=True)
+    cached = os.path.join(VENV_CACHE_DIR, key)
+    staging = os.path.join(VENV_CACHE_DIR, f".tmp-{key}-{os.getpid()}")
+    remove_tree(staging)
+    # Never hardlinked from the project: editing a file in its venv must not reach the cache.
+    # The entry is read-only because restores may hardlink from it.
+    clone_tree(venv_path, staging, hardlink=False)
+    relocate_venv(staging, venv_path, cached)
+    make_read_only(staging)
+    with open(staging + ".json", "w") as f:
+        json.dump({"size": _tree_size(staging)}, f)
+    try:
+        os.rename(staging, cached)
+        os.replace(staging + ".json", cached + ".json")
+    except OSError:
+        # Another run cached the same environment first
+        remove_tree(staging)
+        os.remove(staging + ".json")
+    evict_cached_venvs(keep=key)
+
+def evict_cached_venvs(keep=None, max_bytes=None):
+    """Delete least recently used cached environments until the cache fits in max_bytes."""
+    max_bytes = VENV_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for name in os.listdir(VENV_CACHE_DIR):
+        if not name.endswith(".json") or name.startswith("."):
+            continue
+        meta_path = os.path.join(VENV_CACHE_DIR, name)
+        try:
+            with open(meta_path) as f:
+                size = json.load(f)["size"]
+        except (OSError, ValueError, KeyError):
+            continue
+        entries.append((os.path.getmtime(meta_path), name[:-len(".json")], size))
+    total = sum(size for _, _, size in entries)
+    for _, key, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if key == keep:
+            continue
+        remove_tree(os.path.join(VENV_CACHE_DIR, key))
+        os.remove(os.path.join(VENV_CACHE_DIR, key + ".json"))
+        total -= size
+
+def fetch_tailwind():
+    """Path of the pinned Tailwind stylesheet, downloaded into the cache on first use."""
+    path = os.path.join(ASSETS_CACHE_DIR, f"tailwind-{TAILWIND_VERSION}.min.css")
+    if os.path.isfile(path):
+        return path
+    import urllib.request
+    os.makedirs(ASSETS_CACHE_DIR, exist_ok=True)
+    with urllib.request.urlopen(TAILWIND_URL, timeout=30) as response:
+        data = response.read()
+    # Write then rename so concurrent batch workers never read a partial file
+    staging = f"{path}.{os.getpid()}.tmp"
+    with open(staging, "wb") as f:
+        f.write(data)
+    os.replace(staging, path)
+    return path
+
+def content_hash(data):
+    """SHA-256 hex digest of bytes."""
+    import hashlib
+    return hashlib.sha256(data).hexdigest()
+
+def file_hash(path):
+    """SHA-256 hex digest of a file's contents."""
+    with open(path, "rb") as f:
+        return content_hash(f.read())
+
+def generated_file_action(new_hash, old_hash, disk_hash):
+    """Decide what a run does with one generated file.
+
+    new_hash is the hash of the template output, old_hash the one the manifest
+    recorded (None if the file was never generated) and disk_hash that of the
+    file on disk (None if it is missing). Returns "write", "unchanged", "kept",
+    or "kept_changed" when a kept file no longer matches its template.
+    """
+    if disk_hash is None:
+        # Deleted after generation and the template is the same: respect the deletion
+        return "kept" if old_hash == new_hash else "write"
+    if disk_hash == new_hash:
+        return "unchanged"
+    if disk_hash != old_hash:
+        # Edited locally (or never generated by us): leave it alone
+        return "kept" if old_hash == new_hash else "kept_changed"
+    return "write"
+
+def read_generation_manifest(project_path):
+    """Load the manifest left by a previous generation run, or {} for a new project."""
+    try:
+        with open(os.path.join(project_path, GENERATION_MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_generation_manifest(project_path, manifest):
+    """Save the generated files' hashes and the dependency hash into the project."""
+    manifest_path = os.path.join(project_path, GENERATION_MANIFEST)
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+@contextlib.contextmanager
+def timed_phase(phases, name):
+    """Record the wall-clock duration of a block in phases[name], using a monotonic clock."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = time.perf_counter() - start
+
+def write_timing_report(project_path, report):
+    """Write the generation timing report to .flask_automator/timings.json in the project."""
+    report_dir = os.path.join(project_path, ".flask_automator")
+    os.makedirs(report_dir, exist_ok=True)
+    report_path = os.path.join(report_dir, "timings.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report_path
+
+# Extra template packs are <name>.zip archives looked up in these directories
+PACK_DIRS = [
+    os.path.join(CACHE_DIR, "packs"),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "packs")
+]
+
+class PackTemplate(string.Template):
+    """Pack file template; %%{name} placeholders leave Jinja and Python syntax alone."""
+    delimiter = "%%"
+
+def _read_pack_archive(name):
+    """Read a pack archive: pack.json plus its file tree under files/."""
+    import zipfile
+    for pack_dir in PACK_DIRS:
+        archive_path = os.path.join(pack_dir, f"{name}.zip")
+        if os.path.isfile(archive_path):
+            break
+    else:
+        raise ValueError(f"Unknown template pack: {name}")
+    with zipfile.ZipFile(archive_path) as archive:
+        # Read every member in one pass rather than extracting files one at a time
+        members = {info.filename: archive.read(info) for info in archive.infolist() if not info.is_dir()}
+    definition = json.loads(members.pop("pack.json"))
+    structure = {path: [] for path in definition.get("directories", [])}
+    templates = {}
+    for member, data in members.items():
+        if member.startswith("files/"):
+            path = member[len("files/"):]
+            structure[path] = path
+            templates[path] = data.decode("utf-8")
+    return {**definition, "structure": structure}, templates
+
+@functools.lru_cache(maxsize=None)
+def load_template_pack(name):
+    """Load and compile a template pack, once per process."""
+    if name in TEMPLATE_PACKS:
+        definition = TEMPLATE_PACKS[name]
+        templates = definition.get("templates", TEMPLATES)
+    else:
+        definition, templates = _read_pack_archive(name)
+    structure = tuple(
+        (path, None if isinstance(content, list) else compile_template(templates.get(content, content)))
+        for path, content in definition["structure"].items()
+    )
+    return {
+        "name": name,
+        "description": definition.get("description", ""),
+        "structure": structure,
+        "dependencies": tuple(definition.get("dependencies", DEPENDENCIES)),
+        "launch": definition.get("launch", True),
+        # Defaults the pack sets for generation options; explicit options still win
+        "options": dict(definition.get("options", {}))
+    }
+
+def list_template_packs():
+    """Names of the built-in packs followed by any pack archives found on disk."""
+    names = list(TEMPLATE_PACKS)
+    for pack_dir in PACK_DIRS:
+        if os.path.isdir(pack_dir):
+            names += sorted(
+                name[:-len(".zip")] for name in os.listdir(pack_dir)
+                if name.endswith(".zip") and name[:-len(".zip")] not in names
+            )
+    return names
+
+GUNICORN_WORKER_CLASSES = ["sync", "gthread", "gevent"]
+
+# Database backends: (default URL, driver package); SQLite needs no driver
+DATABASES = {
+    "sqlite": ("sqlite:///app.db", None),
+    "postgresql": ("postgresql+psycopg2://localhost/%%{project_name}", "psycopg2-binary"),
+    "mysql": ("mysql+pymysql://localhost/%%{project_name}", "PyMySQL")
+}
+
+ASSET_LINKS = """<link href="{{ asset_url('css/tailwind.css') }}" rel="stylesheet">
+<link href="{{ asset_url('css/styles.css') }}" rel="stylesheet">
+<script src="{{ asset_url('js/script.js') }}" defer></script>"""
+CDN_LINKS = f'<link href="{TAILWIND_URL}" rel="stylesheet">'
+
+# How init_factory_py differs between the built-in packs: the Flask() arguments,
+# where Flask-Login sends anonymous users and the module holding the blueprint
+APP_FACTORY_LAYOUTS = {
+    "full-stack": {
+        "factory_app_args": "__name__,\n    static_folder='../frontend/static',\n    template_folder='../frontend/templates'",
+        "factory_login_view": "'auth.login'",
+        "factory_blueprint": "main"
+    },
+    "api": {
+        "factory_app_args": "__name__",
+        "factory_login_view": "None",
+        "factory_blueprint": "api"
+    }
 }
 
-def browse_folder(entry):
-    """Open folder browser dialog and update the entry field with selected path."""
-    path = filedialog.askdirectory()
-    if path:
-        entry.delete(0, ctk.END)
-        entry.insert(0, path)
+def uses_app_factory(pack, options):
+    """True if the app factory option is on and the pack has a factory layout."""
+    return options["app_factory"] and pack["name"] in APP_FACTORY_LAYOUTS
 
-def start_creation(project_name, base_path, progress_bar, status_label, create_btn, app):
-    """Start project creation in a separate thread to keep UI responsive."""
-    if not project_name or not base_path:
-        status_label.configure(text="⚠️ Please provide project name and location", text_color="orange")
-        return
+def builds_json_api(pack, options):
+    """True if the JSON API option is on and the pack serves HTTP with the User model."""
+    return (
+        options["json_api"] and pack["launch"]
+        and any(path == "backend/models/user.py" for path, _ in pack["structure"])
+    )
+
+def builds_assets(pack, options):
+    """True if the asset pipeline applies: the option is on and the pack has static files."""
+    return options["assets"] and any(path.startswith("frontend/static/") for path, _ in pack["structure"])
+
+def template_params(project_name, pack, options):
+    """Values substituted into the pack templates."""
+    # Extra lines appended to backend/__init__.py once the app and its blueprints exist
+    app_setup = []
+    if builds_assets(pack, options):
+        app_setup.append(TEMPLATES["assets_setup"])
+    if builds_json_api(pack, options):
+        app_setup.append(TEMPLATES["json_api_setup"])
+    if pack["launch"] and options["instrumentation"]:
+        app_setup.append(TEMPLATES["instrumentation_setup"])
+    app_setup = "".join(app_setup)
+    if uses_app_factory(pack, options):
+        # Runs inside create_app()
+        app_setup = textwrap.indent(app_setup, "    ")
+    return {
+        "project_name": project_name,
+        "project_title": re.sub(r"[-_]+", " ", project_name).strip().title() or project_name,
+        "worker_class": options["worker_class"],
+        "database_url": compile_template(DATABASES[options["database"]][0]).safe_substitute(project_name=project_name),
+        "head_assets": ASSET_LINKS if builds_assets(pack, options) else CDN_LINKS,
+        "tailwind_url": TAILWIND_URL,
+        "app_setup": app_setup,
+        **APP_FACTORY_LAYOUTS.get(pack["name"], {}),
+        # How run.py gets the app when it is rendered from run_reloader_py
+        "app_import": (
+            "from backend import create_app\n\napp = create_app()\n" if uses_app_factory(pack, options)
+            else "from backend import app\n"
+        )
+    }
+
+def option_structure(pack, options):
+    """Extra files that generation options add on top of the pack, in FOLDER_STRUCTURE format."""
+    structure = {}
+    if "flask-sqlalchemy" in pack["dependencies"]:
+        structure["backend/database.py"] = "database_sqlite_py" if options["database"] == "sqlite" else "database_server_py"
+    if uses_app_factory(pack, options):
+        structure["backend/__init__.py"] = "init_factory_py"
+        structure["run.py"] = "run_factory_py"
+        structure["tests/conftest.py"] = "conftest_py"
+        # Puts the project root on sys.path, so a plain `pytest` finds backend too
+        structure["pytest.ini"] = "[pytest]\npythonpath = .\ntestpaths = tests\n"
+        structure["tests/test_health.py"] = "test_health_py"
+    if builds_json_api(pack, options):
+        structure["backend/utils/json_api.py"] = "json_api_py"
+        structure["backend/routes/users_api.py"] = "users_api_py"
+    if builds_assets(pack, options):
+        structure["frontend/assets"] = []
+        structure["backend/assets.py"] = "assets_py"
+        structure["tools/build_assets.py"] = "build_assets_py"
+    # Server options only apply to packs that serve HTTP
+    if not pack["launch"]:
+        return structure
+    if options["instrumentation"]:
+        structure["backend/instrumentation.py"] = "instrumentation_py"
+    if options["reloader"]:
+        structure["run.py"] = "run_reloader_py"
+        env = dict(pack["structure"]).get(".env")
+        if env is not None:
+            structure[".env"] = env.template + TEMPLATES["reloader_env"]
+    if options["bench"]:
+        structure["bench/__init__.py"] = ""
+        structure["bench/loadgen.py"] = "bench_loadgen_py"
+        structure["bench/compare.py"] = "bench_compare_py"
+    if options["server_profile"] == "production":
+        structure["gunicorn.conf.py"] = "gunicorn_conf"
+        structure["wsgi.py"] = "wsgi_factory_py" if uses_app_factory(pack, options) else "wsgi_py"
+    return structure
+
+def option_dependencies(pack, options):
+    """Extra packages that generation options need."""
+    dependencies = []
+    driver = DATABASES[options["database"]][1]
+    if driver and "flask-sqlalchemy" in pack["dependencies"]:
+        dependencies.append(driver)
+    if uses_app_factory(pack, options):
+        dependencies.append("pytest")
+    if builds_json_api(pack, options):
+        dependencies.append("orjson")
+    if pack["launch"] and options["reloader"]:
+        dependencies.append("watchdog")
+    if pack["launch"] and options["server_profile"] == "production" and options["worker_class"] == "gevent":
+        dependencies.append("gevent")
+    return dependencies
+
+def validate_options(options):
+    """Raise ValueError for option values generation does not know about."""
+    if options["server_profile"] not in ("dev", "production"):
+        raise ValueError(f"Unknown server profile: {options['server_profile']}")
+    if options["worker_class"] not in GUNICORN_WORKER_CLASSES:
+        raise ValueError(f"Unknown gunicorn worker class: {options['worker_class']}")
+    if options["database"] not in DATABASES:
+        raise ValueError(f"Unknown database: {options['database']}")
+
+@functools.lru_cache(maxsize=None)
+def compile_template(source):
+    """Compile template source once per process."""
+    return PackTemplate(source)
+
+def render_project_files(pack, options, params):
+    """Render a compiled pack plus the files enabled by options into (path, text) pairs.
+
+    text is None for directories.
+    """
+    files = {
+        path: None if template is None else template.safe_substitute(params)
+        for path, template in pack["structure"]
+    }
+    for path, content in option_structure(pack, options).items():
+        files[path] = None if isinstance(content, list) else compile_template(TEMPLATES.get(content, content)).safe_substitute(params)
+    return list(files.items())
+
+def port_in_use(host, port):
+    """Return True if something is already accepting connections on host:port."""
+    import socket
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex((host, port)) == 0
+
+def wait_for_server(process, url, timeout, cancel_event=None):
+    """Block until url answers over HTTP, polling with exponential backoff.
+
+    Raises RuntimeError as soon as the server process exits, or when it has
+    not answered within timeout seconds.
+    """
+    import urllib.request
+    import urllib.error
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError(f"Flask app exited during startup (exit code {process.returncode})")
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except urllib.error.HTTPError:
+            # Any HTTP response means the server is up, even if the route is missing
+            return
+        except (urllib.error.URLError, OSError):
+            pass
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"Flask app did not respond at {url} within {timeout} seconds")
+        pause = min(delay, max(deadline - time.monotonic(), 0))
+        if cancel_event is None:
+            time.sleep(pause)
+        elif cancel_event.wait(pause):
+            process.terminate()
+            raise GenerationCancelled()
+        delay = min(delay * 2, 1.0)
+
+def run_steps(steps, progress_callback=None, max_workers=4, cancel_event=None):
+    """Run a dependency graph of steps on a thread pool.
+
+    Each step is a dict with a "name", a "run" callable, the names of the steps
+    it must run "after" and a "weight" for the overall progress bar. run() is
+    called with report(fraction, message, color) to publish progress within
+    the step. A step starts as soon as everything it depends on has finished;
+    after a failure no new steps are started and the first error is raised.
+    Setting cancel_event stops the run the same way with GenerationCancelled,
+    which is also raised from report() inside running steps.
+
+    Returns the per-step durations and the critical path through the graph.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    names = {step["name"] for step in steps}
+    deps = {step["name"]: [dep for dep in step.get("after", []) if dep in names] for step in steps}
+    weights = {step["name"]: step.get("weight", 1) for step in steps}
+    total_weight = sum(weights.values())
+    fractions = dict.fromkeys(names, 0.0)
+    timings = {}
+    lock = threading.Lock()
     
-    # Show progress bar and update UI
-    progress_bar.pack(fill="x", pady=10)
-    status_label.configure(text="⏳ Initializing project creation...", text_color="grey")
-    create_btn.configure(state="disabled", text="Creating Project...")
-    progress_bar.set(0)  # Reset progress bar
+    def make_reporter(name):
+        def report(fraction, message, color="grey"):
+            if cancel_event is not None and cancel_event.is_set():
+                raise GenerationCancelled()
+            with lock:
+                fractions[name] = max(fractions[name], min(fraction, 1.0))
+                percent = 100 * sum(fractions[n] * weights[n] for n in names) / total_weight
+            if progress_callback:
+                progress_callback(percent, message, color)
+        return report
     
-    # Start the creation in a separate thread to avoid UI freezing
-    thread = threading.Thread(
-        target=create_project,
-        args=(project_name, base_path, progress_bar, status_label, create_btn, app)
-    )
-    thread.daemon = True
-    thread.start()
+    def run_timed(step):
+        start = time.perf_counter()
+        try:
+            step["run"](make_reporter(step["name"]))
+        finally:
+            timings[step["name"]] = (start, time.perf_counter())
+    
+    done, running, error = set(), {}, None
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            if error is None and cancel_event is not None and cancel_event.is_set():
+                error = GenerationCancelled()
+            if error is None:
+                for step in steps:
+                    name = step["name"]
+                    if name not in done and name not in running.values() and all(dep in done for dep in deps[name]):
+                        running[pool.submit(run_timed, step)] = name
+            if not running:
+                break
+            # Wake up regularly so a cancellation is noticed between steps
+            finished, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                    done.add(name)
+                    with lock:
+                        fractions[name] = 1.0
+                except Exception as e:
+                    error = error or e
+    if error:
+        raise error
+    
+    # Walk back from the last step to finish, always through the dependency that finished last
+    path = [max(timings, key=lambda name: timings[name][1])]
+    while deps[path[-1]]:
+        path.append(max(deps[path[-1]], key=lambda name: timings[name][1]))
+    path.reverse()
+    return {
+        "durations": {name: end - start for name, (start, end) in timings.items()},
+        "critical_path": path,
+        "elapsed": max(end for _, end in timings.values()) - min(start for start, _ in timings.values())
+    }
 
-def create_project(project_name, base_path, progress_bar, status_label, create_btn, app):
-    """Create a Flask project with the specified structure and settings."""
+def generate_project(project_name, base_path, options=None, progress_callback=None, cancel_event=None,
+                     log_callback=None):
+    """Create a Flask project without any GUI.
+
+    progress_callback(percent, message, color) is called as generation advances
+    and log_callback(line) with every line the external commands print.
+    Fatal errors raise RuntimeError; non-fatal problems are returned in the
+    result's "warnings" list. Setting cancel_event (a threading.Event) stops
+    generation with GenerationCancelled, terminating any running command.
+    """
+    import subprocess
+    import webbrowser
+    options = options or {}
+    pack = load_template_pack(options.get("template_pack", DEFAULT_OPTIONS["template_pack"]))
+    options = {**DEFAULT_OPTIONS, **pack["options"], **options}
     project_path = os.path.join(base_path, project_name)
+    validate_options(options)
+    dependencies = list(pack["dependencies"]) + option_dependencies(pack, options)
+    # A new project is built in a sibling staging directory (same filesystem) and renamed
+    # into place once complete; re-runs update the existing project in place
+    staged = not os.path.exists(project_path)
+    work_path = os.path.join(base_path, f".{project_name}.staging-{os.getpid()}") if staged else project_path
+    venv_path = os.path.join(work_path, "venv")
+    pip_path, python_path = venv_executables(venv_path)
+    result = {"project_path": project_path, "warnings": [], "url": None, "pid": None}
+    state = {
+        "venv_key": None, "venv_from_cache": False, "venv_reused": False, "venv_ready": False,
+        "locked": False, "published": not staged
+    }
+    phases = {}
+    manifest = read_generation_manifest(project_path)
+    previous_files = manifest.get("files", {})
+    generated_files = {}
+    created_dirs = set()
+    result["files"] = {"written": [], "unchanged": [], "kept": []}
     
-    # Helper function to update progress bar and status
+    # Helper function to report progress outside of the scheduled steps
     def update_status(percent, message, color="grey"):
-        app.after(0, lambda p=percent/100, m=message, c=color: (
-            progress_bar.set(p),
-            status_label.configure(text=m, text_color=c)
-        ))
-        app.update_idletasks()
-        time.sleep(0.1)  # Small delay for visual effect
+        if progress_callback:
+            progress_callback(percent, message, color)
     
-    # Helper function to show error dialog
-    def show_error(title, message):
-        app.after(0, lambda t=title, m=message: messagebox.showerror(t, m))
+    # Helper function to tag command output with the step it came from
+    def command_log(step):
+        if log_callback is None:
+            return None
+        return lambda line: log_callback(f"[{step}] {line}")
     
-    # Helper function to show warning dialog
-    def show_warning(title, message):
-        app.after(0, lambda t=title, m=message: messagebox.showwarning(t, m))
+    # Helper function to record and report a non-fatal problem
+    def warn(report, message):
+        result["warnings"].append(message)
+        report(1.0, f"⚠️ {message}", "orange")
     
-    # Helper function to show info dialog
-    def show_info(title, message):
-        app.after(0, lambda t=title, m=message: messagebox.showinfo(t, m))
+    # Initialize project directory
+    update_status(0, "📁 Updating existing project..." if manifest else "📁 Creating project directory...")
+    if staged:
+        shutil.rmtree(work_path, ignore_errors=True)
+    os.makedirs(work_path, exist_ok=True)
     
     try:
-        # Initialize project directory
-        update_status(5, "📁 Creating project directory...", "grey")
-        os.makedirs(project_path, exist_ok=True)
-        
-        # Step 1: Create folder structure (0-15%)
-        file_count = len(FOLDER_STRUCTURE)
-        for idx, (path, content) in enumerate(FOLDER_STRUCTURE.items()):
-            # Calculate progress percentage (0-15% range for this step)
-            percent = 5 + (idx / file_count * 10)
-            update_status(percent, f"📁 Creating project structure ({idx+1}/{file_count})...")
+        state["venv_key"] = dependency_hash("python", dependencies)
+    except Exception as e:
+        result["warnings"].append(f"Could not hash the dependency set: {e}")
+    # Nothing to do for the venv when the dependency set is unchanged since the last run
+    venv_current = (
+        state["venv_key"] is not None
+        and manifest.get("dependency_hash") == state["venv_key"]
+        and os.path.exists(python_path)
+    )
+    
+    # Step 1: Create folder structure
+    def scaffold(report):
+        entries = render_project_files(pack, options, template_params(project_name, pack, options))
+        file_count = len(entries)
+        # Report about ten times in total rather than once per file
+        report_every = max(1, file_count // 10)
+        for idx, (path, content) in enumerate(entries):
+            if idx % report_every == 0:
+                report(idx / file_count, f"📁 Creating project structure ({idx+1}/{file_count})...")
             
-            full_path = os.path.join(project_path, path)
-            if isinstance(content, list):
-                os.makedirs(full_path, exist_ok=True)
-            else:
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(TEMPLATES.get(content, content))
-        
-        # Step 2: Initialize Git (15-20%)
-        update_status(15, "🔄 Initializing Git repository...")
+            full_path = os.path.join(work_path, path)
+            with timed_phase(phases, f"scaffold/{path}"):
+                if content is None:
+                    make_dir(full_path)
+                else:
+                    write_generated_file(path, full_path, content)
+        files = result["files"]
+        report(1.0, f"📁 Project structure ready! ({len(files['written'])} written, "
+                    f"{len(files['unchanged'])} unchanged, {len(files['kept'])} kept)")
+    
+    # One mkdir call per directory, however many files it holds
+    def make_dir(path):
+        if path not in created_dirs:
+            os.makedirs(path, exist_ok=True)
+            created_dirs.add(path)
+    
+    # Only touch a file when its template output changed and nobody edited it since it was generated
+    def write_generated_file(path, full_path, text):
+        data = text.replace("\n", os.linesep).encode("utf-8")
+        new_hash = content_hash(data)
+        old_hash = previous_files.get(path)
+        exists = os.path.exists(full_path)
+        if exists and path in STEP_OUTPUTS:
+            return
+        action = generated_file_action(new_hash, old_hash, file_hash(full_path) if exists else None)
+        if action == "unchanged":
+            generated_files[path] = new_hash
+            result["files"]["unchanged"].append(path)
+            return
+        if action in ("kept", "kept_changed"):
+            if old_hash is not None:
+                generated_files[path] = old_hash
+            if action == "kept_changed":
+                result["warnings"].append(f"Kept locally modified {path}; the template has changed")
+            result["files"]["kept"].append(path)
+            return
+        make_dir(os.path.dirname(full_path))
+        with open(full_path, "wb") as f:
+            f.write(data)
+        if path not in STEP_OUTPUTS:
+            generated_files[path] = new_hash
+        result["files"]["written"].append(path)
+    
+    # requirements.txt is rewritten when the dependencies change, unless it was edited since
+    # the last run; then the new pins go next to the manifest instead
+    def write_requirements(text):
+        path = "requirements.txt"
+        full_path = os.path.join(work_path, path)
+        old_hash = previous_files.get(path)
+        if os.path.exists(full_path) and os.path.getsize(full_path) and file_hash(full_path) != old_hash:
+            if old_hash is not None:
+                generated_files[path] = old_hash
+            full_path = os.path.join(work_path, ".flask_automator", path)
+            result["warnings"].append(
+                f"Kept locally modified {path}; the new pins are in .flask_automator/{path}"
+            )
+            result["files"]["kept"].append(path)
+            make_dir(os.path.dirname(full_path))
+            with open(full_path, "w") as f:
+                f.write(text)
+            return
+        with open(full_path, "w") as f:
+            f.write(text)
+        generated_files[path] = file_hash(full_path)
+    
+    # Step 2: Initialize Git
+    def git_init(report):
+        report(0, "🔄 Initializing Git repository...")
         try:
-            subprocess.call(["git", "init"], cwd=project_path)
-            update_status(20, "🔄 Git repository initialized!")
+            with timed_phase(phases, "git/init"):
+                run_command(
+                    ["git", "init"], cwd=work_path, timeout=COMMAND_TIMEOUTS["git"],
+                    cancel_event=cancel_event, on_line=command_log("git")
+                )
+            report(1.0, "🔄 Git repository initialized!")
+        except GenerationCancelled:
+            raise
         except Exception as e:
             # Continue even if git fails
-            error_msg = str(e)
-            update_status(20, f"⚠️ Git initialization skipped: {error_msg}", "orange")
-            time.sleep(1)  # Show warning briefly
-        
-        # Step 3: Create virtual environment (20-35%)
-        update_status(25, "🔧 Creating virtual environment...")
+            warn(report, f"Git initialization skipped: {e}")
+    
+    # Runs once requirements.txt is final, so the commit holds the lock or the freeze;
+    # venv/ is excluded by .gitignore
+    def git_commit(report):
+        report(0, "🔄 Creating initial commit...")
         try:
-            subprocess.call(["python", "-m", "venv", "venv"], cwd=project_path)
-            update_status(35, "🔧 Virtual environment created!")
+            with timed_phase(phases, "git/commit"):
+                for command in (["git", "add", "-A"], ["git", "commit", "-q", "-m", "Initial commit"]):
+                    run_command(
+                        command, cwd=work_path, timeout=COMMAND_TIMEOUTS["git"],
+                        cancel_event=cancel_event, on_line=command_log("git")
+                    )
+            report(1.0, "🔄 Initial commit created!")
+        except GenerationCancelled:
+            raise
         except Exception as e:
-            error_msg = str(e)
-            show_error("Error", f"Failed to create virtual environment: {error_msg}")
-            update_status(35, f"❌ Error creating virtual environment", "red")
-            app.after(0, lambda: create_btn.configure(state="normal", text="Create Project"))
+            warn(report, f"Initial commit skipped: {e}")
+    
+    # Step 3: Create virtual environment
+    def create_venv(report):
+        if os.path.exists(python_path):
+            # The dependency set changed since the last run: install the new set into the
+            # existing environment, so packages installed by hand are kept
+            state["venv_reused"] = True
+            report(1.0, "🔧 Updating the existing virtual environment...")
             return
+        shutil.rmtree(venv_path, ignore_errors=True)
+        if options["venv_cache"] and state["venv_key"]:
+            try:
+                with timed_phase(phases, "venv/restore_cache"):
+                    report(0.1, "🔧 Looking for a cached virtual environment...")
+                    state["venv_from_cache"] = restore_cached_venv(state["venv_key"], venv_path)
+            except Exception as e:
+                # Any cache problem just means building from scratch
+                shutil.rmtree(venv_path, ignore_errors=True)
+                warn(report, f"Virtual environment cache unavailable: {e}")
         
-        # Ensure the virtual environment paths work for Windows and Linux
-        venv_path = os.path.join(project_path, "venv")
-        pip_path = os.path.join(venv_path, "Scripts", "pip.exe") if os.name == 'nt' else os.path.join(venv_path, "bin", "pip")
-        python_path = os.path.join(venv_path, "Scripts", "python.exe") if os.name == 'nt' else os.path.join(venv_path, "bin", "python")
-        
-        # Step 4: Install dependencies (35-85%)
-        update_status(35, "📦 Installing dependencies...")
+        if state["venv_from_cache"]:
+            report(1.0, "🔧 Virtual environment restored from cache!")
+            return
+        report(0.2, "🔧 Creating virtual environment...")
+        try:
+            with timed_phase(phases, "venv/create"):
+                run_command(
+                    ["python", "-m", "venv", "venv"], cwd=work_path, timeout=COMMAND_TIMEOUTS["venv"],
+                    cancel_event=cancel_event, on_line=command_log("venv")
+                )
+        except GenerationCancelled:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to create virtual environment: {e}") from e
+        report(1.0, "🔧 Virtual environment created!")
+    
+    # Pin the dependency tree, resolving once per dependency set: hashed for installing
+    # here, plain name==version pins in requirements.txt
+    def lock(report):
+        if not state["venv_key"] or not os.path.exists(pip_path):
+            return None
+        report(0, "🔒 Locking dependencies...")
+        try:
+            with timed_phase(phases, "install/lock"):
+                packages = lock_dependencies(
+                    pip_path, dependencies, state["venv_key"], cancel_event, command_log("pip")
+                )
+                lockfile = os.path.join(work_path, PROJECT_LOCKFILE)
+                make_dir(os.path.dirname(lockfile))
+                with open(lockfile, "w") as f:
+                    f.write(format_lockfile(packages))
+                write_requirements(format_pins(packages))
+        except GenerationCancelled:
+            raise
+        except Exception as e:
+            result["warnings"].append(f"Could not lock dependencies, using pip freeze instead: {e}")
+            report(0, f"⚠️ Could not lock dependencies: {e}", "orange")
+            return None
+        state["locked"] = True
+        return lockfile
+    
+    # Step 4: Install dependencies
+    def install(report):
+        lockfile = lock(report)
+        if state["venv_from_cache"]:
+            state["venv_ready"] = True
+            report(1.0, "📦 Dependencies already installed in cached environment!")
+            return
+        report(0, "📦 Installing dependencies...")
         try:
             # Check if pip exists
             if not os.path.exists(pip_path):
                 error_msg = f"Pip not found at: {pip_path}"
                 raise FileNotFoundError(error_msg)
             
-            # Upgrade pip first
-            update_status(40, "📦 Upgrading pip...")
-            subprocess.call([pip_path, "install", "--upgrade", "pip"])
+            # Install the whole dependency set in one pip run. Progress follows pip's
+            # own output: pip works through the packages in order and installs them
+            # together at the end, so each package is timed until pip reaches the next one.
+            last_event = [time.perf_counter()]
             
-            # Install each dependency with feedback
-            dep_progress_base = 45
-            dep_progress_step = 35 / len(DEPENDENCIES)  # 35% of progress bar for dependencies
+            def report_package(idx, dep, total):
+                now = time.perf_counter()
+                phases[f"install/{dep}"] = now - last_event[0]
+                last_event[0] = now
+                report((idx + 1) / (total + 1), f"📦 Installing {dep}... ({idx+1}/{total})")
             
-            for idx, dep in enumerate(DEPENDENCIES):
-                current_progress = dep_progress_base + (idx * dep_progress_step)
-                update_status(
-                    current_progress, 
-                    f"📦 Installing {dep}... ({idx+1}/{len(DEPENDENCIES)})"
-                )
-                subprocess.call([pip_path, "install", dep])
-                
-                # Update progress after each dependency is installed
-                update_status(
-                    current_progress + dep_progress_step/2,  # Halfway through this dependency's allocation
-                    f"📦 Installed {dep}!"
-                )
+            install_dependencies(
+                pip_path, dependencies, on_package=report_package, cancel_event=cancel_event,
+                lockfile=lockfile, on_line=command_log("pip")
+            )
+            phases["install/finalize"] = time.perf_counter() - last_event[0]
+        except GenerationCancelled:
+            raise
         except Exception as e:
-            error_msg = str(e)
-            show_error("Error", f"Failed to install dependencies: {error_msg}")
-            update_status(80, f"❌ Error installing dependencies", "red")
-            app.after(0, lambda: create_btn.configure(state="normal", text="Create Project"))
+            raise RuntimeError(f"Failed to install dependencies: {e}") from e
+        state["venv_ready"] = True
+        report(1.0, "📦 Dependencies installed!")
+    
+    # Keep the populated environment for the next project with the same dependencies
+    def cache_venv(report):
+        # A reused environment may hold packages of its own, so it is never cached
+        if state["venv_from_cache"] or state["venv_reused"] or not state["venv_key"] or not options["venv_cache"]:
             return
-        
-        # Step 5: Write requirements.txt (85-90%)
-        update_status(85, "📄 Generating requirements.txt...")
         try:
-            result = subprocess.run([pip_path, "freeze"], capture_output=True, text=True)
-            with open(os.path.join(project_path, "requirements.txt"), "w") as req_file:
-                req_file.write(result.stdout)
-            update_status(90, "📄 Requirements.txt generated!")
+            report(0, "💾 Caching virtual environment...")
+            with timed_phase(phases, "venv/store_cache"):
+                store_cached_venv(state["venv_key"], venv_path)
+            report(1.0, "💾 Virtual environment cached!")
         except Exception as e:
-            error_msg = str(e)
-            show_warning("Warning", f"Could not generate requirements.txt: {error_msg}")
-            update_status(90, f"⚠️ Could not generate requirements.txt", "orange")
-        
-        # Step 6: Launch Flask App (90-95%)
-        update_status(90, "✅ Setup complete! Launching Flask App...", "green")
-        
-        # Step 7: Final steps (95-100%)
+            warn(report, f"Could not cache virtual environment: {e}")
+    
+    # Step 5: Write requirements.txt, unless it already holds the lock
+    def freeze(report):
+        if state["locked"]:
+            report(1.0, "📄 requirements.txt pinned from the lock!")
+            return
+        report(0, "📄 Generating requirements.txt...")
+        try:
+            with timed_phase(phases, "freeze"):
+                # Collected in full rather than from the bounded output buffer
+                frozen = []
+                run_command([pip_path, "freeze"], timeout=COMMAND_TIMEOUTS["pip"], cancel_event=cancel_event, on_line=frozen.append)
+                write_requirements("\n".join(frozen) + "\n")
+            report(1.0, "📄 Requirements.txt generated!")
+        except GenerationCancelled:
+            raise
+        except Exception as e:
+            warn(report, f"Could not generate requirements.txt: {e}")
+    
+    # Purge, fingerprint and precompress the static files with the project's own build script
+    def build_assets(report):
+        vendored = os.path.join(work_path, "frontend", "assets", "tailwind.css")
+        fetch_error = None
+        if not os.path.exists(vendored):
+            report(0, "🎨 Vendoring Tailwind CSS...")
+            try:
+                with timed_phase(phases, "assets/fetch"):
+                    shutil.copyfile(fetch_tailwind(), vendored)
+            except Exception as e:
+                fetch_error = e
+        report(0.5, "🎨 Building static assets...")
+        try:
+            with timed_phase(phases, "assets/build"):
+                run_command(
+                    [python_path, os.path.join("tools", "build_assets.py")], cwd=work_path,
+                    timeout=COMMAND_TIMEOUTS["assets"], cancel_event=cancel_event, on_line=command_log("assets")
+                )
+        except GenerationCancelled:
+            raise
+        except Exception as e:
+            warn(report, f"Asset build failed: {e}")
+            return
+        if fetch_error is not None:
+            # The build skipped the purge; asset_url() links the CDN stylesheet instead
+            warn(report, f"Static assets built without Tailwind, which is loaded from the CDN for now. "
+                         f"Save {TAILWIND_URL} as frontend/assets/tailwind.css and run tools/build_assets.py: "
+                         f"{fetch_error}")
+            return
+        report(1.0, "🎨 Static assets built!")
+    
+    # Move a staged project into place with a single rename
+    def publish(report):
+        report(0, "📁 Moving project into place...")
+        if os.path.exists(project_path):
+            raise RuntimeError(f"{project_path} was created by something else during generation")
+        record_manifest(work_path)
+        if os.path.isdir(venv_path):
+            relocate_venv(venv_path, venv_path, os.path.join(project_path, "venv"))
+        os.rename(work_path, project_path)
+        state["published"] = True
+        report(1.0, "📁 Project moved into place!")
+    
+    def record_manifest(path):
+        # Step outputs not rewritten this run keep the hash they were written with
+        carried = {name: previous_files[name] for name in STEP_OUTPUTS if name in previous_files}
+        write_generation_manifest(path, {
+            "files": {**carried, **generated_files},
+            "dependency_hash": state["venv_key"] if venv_current or state["venv_ready"] else None
+        })
+    
+    # Step 6: Launch Flask App
+    def launch(report):
+        report(0, "✅ Setup complete! Launching Flask App...", "green")
+        if port_in_use(FLASK_HOST, FLASK_PORT):
+            raise RuntimeError(f"Port {FLASK_PORT} is already in use, stop the other server first")
+        # Runs after publish, so from the project's final location
+        python_path = venv_executables(os.path.join(project_path, "venv"))[1]
         try:
             if os.name == 'nt':
                 flask_process = subprocess.Popen(
@@ -276,49 +2479,356 @@ def create_project(project_name, base_path, progress_bar, status_label, create_b
                     [python_path, "run.py"],
                     cwd=project_path
                 )
-            
-            update_status(95, "🚀 Starting Flask app...", "green")
-            
-            # Wait for server to start before opening browser
-            time.sleep(4)  # Adjust as needed based on your server startup time
-            
-            if flask_process.poll() is None:
-                update_status(100, "🎉 Project created successfully! App is running", "green")
-                webbrowser.open('http://127.0.0.1:5000/')
-                show_info(
-                    "Success", 
-                    f"🚀 Flask app for '{project_name}' is now running!\n\nURL: http://127.0.0.1:5000/"
-                )
-                
-                # Launch VSCode if available
-                try:
-                    subprocess.Popen(["code.cmd", project_path])
-                    update_status(100, "🎉 Project created successfully! Opening in VSCode...", "green")
-                except:
-                    update_status(100, "🎉 Project created successfully! (VSCode not found)", "green")
-            else:
-                show_error("Error", "Failed to start Flask app")
-                update_status(100, "❌ Error starting Flask app", "red")
         except Exception as e:
-            error_msg = str(e)
-            show_error("Error", f"Failed to start Flask app:\n{error_msg}")
-            update_status(100, f"❌ Error: {error_msg}", "red")
+            raise RuntimeError(f"Failed to start Flask app:\n{e}") from e
         
+        report(0.5, "🚀 Starting Flask app...", "green")
+        
+        # Wait until the server actually answers before opening the browser
+        with timed_phase(phases, "server_ready"):
+            wait_for_server(flask_process, HEALTH_URL, SERVER_START_TIMEOUT, cancel_event)
+        result["url"] = FLASK_URL
+        result["pid"] = flask_process.pid
+    
+    steps = [{"name": "scaffold", "run": scaffold, "weight": 2}]
+    if not venv_current:
+        steps += [
+            {"name": "venv", "run": create_venv, "weight": 3},
+            {"name": "install", "run": install, "after": ["venv"], "weight": 10},
+            {"name": "cache_venv", "run": cache_venv, "after": ["install"], "weight": 1},
+            {"name": "freeze", "run": freeze, "after": ["install", "scaffold"], "weight": 1}
+        ]
+    if builds_assets(pack, options):
+        # Runs with the project's interpreter, so only after the venv exists
+        steps.append({"name": "assets", "run": build_assets, "after": ["scaffold", "venv"], "weight": 1})
+    # An existing repository is left alone on re-runs
+    if options["git"] and not os.path.exists(os.path.join(project_path, ".git")):
+        steps += [
+            {"name": "git_init", "run": git_init, "weight": 1},
+            {"name": "git_commit", "run": git_commit, "after": ["scaffold", "git_init", "assets", "freeze"], "weight": 1}
+        ]
+    if staged:
+        steps.append({"name": "publish", "run": publish, "after": [step["name"] for step in steps], "weight": 1})
+    if options["launch"] and pack["launch"]:
+        steps.append({"name": "launch", "run": launch, "after": ["freeze", "scaffold", "assets", "publish"], "weight": 2})
+    
+    try:
+        schedule = run_steps(steps, update_status, cancel_event=cancel_event)
+    finally:
+        if not staged:
+            # Record whatever was generated, even if a later step failed
+            record_manifest(project_path)
+        elif not state["published"]:
+            # A failed or cancelled new project leaves nothing behind
+            shutil.rmtree(work_path, ignore_errors=True)
+    result.update(schedule)
+    result["phases"] = phases
+    try:
+        result["timing_report"] = write_timing_report(project_path, {
+            "project": project_name,
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "elapsed": schedule["elapsed"],
+            "critical_path": schedule["critical_path"],
+            "steps": schedule["durations"],
+            "phases": phases
+        })
+    except OSError as e:
+        result["warnings"].append(f"Could not write timing report: {e}")
+    
+    path = " → ".join(schedule["critical_path"])
+    message = "🎉 Project created successfully! App is running" if result["url"] else "🎉 Project created successfully!"
+    update_status(100, f"{message} (critical path: {path}, {schedule['elapsed']:.1f}s)", "green")
+    if not result["url"]:
+        return result
+    
+    if options["open_browser"]:
+        webbrowser.open(FLASK_URL)
+    
+    # Launch VSCode if available
+    if options["open_editor"]:
+        try:
+            subprocess.Popen(["code.cmd", project_path])
+            update_status(100, "🎉 Project created successfully! Opening in VSCode...", "green")
+        except:
+            update_status(100, "🎉 Project created successfully! (VSCode not found)", "green")
+    return result
+
+def _generate_manifest_entry(entry):
+    """Generate one project from a batch manifest entry (runs in a worker process)."""
+    name = entry["name"]
+    
+    def print_progress(percent, message, color="grey"):
+        print(f"[{name}] {percent:5.1f}% {message}", flush=True)
+    
+    return generate_project(name, entry["path"], entry.get("options"), print_progress)
+
+def generate_batch(entries, workers=None):
+    """Generate many projects concurrently in a process pool.
+
+    Returns a list of (entry, result, error) tuples in manifest order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_generate_manifest_entry, entry) for entry in entries]
+        outcomes = []
+        for entry, future in zip(entries, futures):
+            try:
+                outcomes.append((entry, future.result(), None))
+            except Exception as e:
+                outcomes.append((entry, None, e))
+    return outcomes
+
+def load_manifest(manifest_path, default_path=None):
+    """Read a batch manifest: a JSON list of projects, or an object with a "projects" list.
+
+    Each project is {"name": ..., "path": ..., "options": {...}}; "path" defaults
+    to default_path or the manifest's directory.
+    """
+    with open(manifest_path, encoding="utf-8") as f:
+        data = json.load(f)
+    projects = data["projects"] if isinstance(data, dict) else data
+    base = default_path or os.path.dirname(os.path.abspath(manifest_path))
+    entries = []
+    for project in projects:
+        if isinstance(project, str):
+            project = {"name": project}
+        entries.append({
+            "name": project["name"],
+            "path": project.get("path", base),
+            "options": project.get("options", {})
+        })
+    return entries
+
+def browse_folder(entry):
+    """Open folder browser dialog and update the entry field with selected path."""
+    import customtkinter as ctk
+    from tkinter import filedialog
+    path = filedialog.askdirectory()
+    if path:
+        entry.delete(0, ctk.END)
+        entry.insert(0, path)
+
+FRAME_INTERVAL_MS = 33  # the GUI redraws progress at most ~30 times per second
+
+class ProgressChannel:
+    """Queue between a generation worker thread and the Tk main loop.
+
+    The worker publishes progress and queues UI callbacks without touching any
+    widget; the main loop drains the queue once per frame, so a burst of
+    updates collapses into a single redraw. Cancellation travels the other
+    way through cancel_event. Command output is kept in a bounded buffer so a
+    chatty pip install cannot grow the queue without limit.
+    """
+    
+    def __init__(self):
+        self._events = queue.SimpleQueue()
+        self._log = collections.deque(maxlen=LOG_LINES)
+        self._log_lock = threading.Lock()
+        self.cancel_event = threading.Event()
+        self.closed = False
+    
+    def publish(self, percent, message, color="grey"):
+        """Report progress; a percent of None leaves the progress bar where it is."""
+        self._events.put(("progress", (percent, message, color)))
+    
+    def log(self, line):
+        """Append a line of command output to the log pane."""
+        with self._log_lock:
+            self._log.append(line)
+    
+    def call(self, callback):
+        """Run callback on the main loop, e.g. to show a dialog."""
+        self._events.put(("call", callback))
+    
+    def close(self):
+        """Signal that the worker has finished."""
+        self._events.put(("close", None))
+    
+    def cancel(self):
+        self.cancel_event.set()
+    
+    def drain(self):
+        """Collect everything queued since the last frame.
+
+        Returns the latest percent, the latest (message, color), the queued
+        callbacks in order and the new log lines.
+        """
+        percent = status = None
+        callbacks = []
+        with self._log_lock:
+            lines = list(self._log)
+            self._log.clear()
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if payload[0] is not None:
+                    percent = payload[0]
+                status = payload[1:]
+            elif kind == "call":
+                callbacks.append(payload)
+            else:
+                self.closed = True
+        return percent, status, callbacks, lines
+
+def append_log(log_box, lines):
+    """Append lines to the output pane, keeping only the last LOG_LINES."""
+    log_box.configure(state="normal")
+    log_box.insert("end", "".join(f"{line}\n" for line in lines))
+    excess = int(log_box.index("end-1c").split(".")[0]) - 1 - LOG_LINES
+    if excess > 0:
+        log_box.delete("1.0", f"{excess + 1}.0")
+    log_box.see("end")
+    log_box.configure(state="disabled")
+
+def poll_progress(app, channel, progress_bar, status_label, log_box, on_finish):
+    """Render the coalesced progress once per frame until the worker closes the channel."""
+    percent, status, callbacks, lines = channel.drain()
+    if percent is not None:
+        progress_bar.set(percent / 100)
+    if status is not None:
+        status_label.configure(text=status[0], text_color=status[1])
+    if lines:
+        append_log(log_box, lines)
+    for callback in callbacks:
+        callback()
+    if channel.closed:
+        on_finish()
+    else:
+        app.after(FRAME_INTERVAL_MS, poll_progress, app, channel, progress_bar, status_label, log_box, on_finish)
+
+def start_creation(project_name, base_path, options, progress_bar, status_label, log_box, create_btn, cancel_btn, app):
+    """Start project creation in a separate thread to keep UI responsive."""
+    if not project_name or not base_path:
+        status_label.configure(text="⚠️ Please provide project name and location", text_color="orange")
+        return
+    
+    channel = ProgressChannel()
+    
+    def cancel():
+        channel.cancel()
+        cancel_btn.configure(state="disabled", text="Cancelling...")
+    
+    def finish():
         # Hide progress bar after 3 seconds of showing completion
         app.after(3000, lambda: progress_bar.pack_forget())
-        
+        cancel_btn.pack_forget()
         # Re-enable the create button
-        app.after(0, lambda: create_btn.configure(state="normal", text="Create Project"))
-            
+        create_btn.configure(state="normal", text="Create Project")
+    
+    # Show progress bar and update UI
+    progress_bar.pack(fill="x", pady=10, after=status_label)
+    status_label.configure(text="⏳ Initializing project creation...", text_color="grey")
+    create_btn.configure(state="disabled", text="Creating Project...")
+    cancel_btn.configure(state="normal", text="Cancel", command=cancel)
+    cancel_btn.pack(pady=(0, 10))
+    progress_bar.set(0)  # Reset progress bar
+    log_box.configure(state="normal")
+    log_box.delete("1.0", "end")
+    log_box.configure(state="disabled")
+    
+    # Start the creation in a separate thread to avoid UI freezing
+    thread = threading.Thread(
+        target=create_project,
+        args=(project_name, base_path, options, channel)
+    )
+    thread.daemon = True
+    thread.start()
+    poll_progress(app, channel, progress_bar, status_label, log_box, finish)
+
+def format_timings(result, limit=8):
+    """Summarize the slowest phases of a generation result for display."""
+    lines = [f"Total: {result['elapsed']:.2f}s", f"Critical path: {' → '.join(result['critical_path'])}", ""]
+    slowest = sorted(result["phases"].items(), key=lambda item: item[1], reverse=True)[:limit]
+    lines += [f"{name}: {seconds:.2f}s" for name, seconds in slowest]
+    return "\n".join(lines)
+
+def create_project(project_name, base_path, options, channel):
+    """Create a Flask project for the GUI; runs on a worker thread and talks to the UI only through channel."""
+    from tkinter import messagebox
+    options = dict(options)
+    show_timings = options.pop("show_timings", False)
+    
+    try:
+        result = generate_project(
+            project_name,
+            base_path,
+            {**options, "launch": True, "open_browser": True, "open_editor": True},
+            channel.publish,
+            channel.cancel_event,
+            channel.log
+        )
+        if show_timings:
+            channel.call(lambda: messagebox.showinfo("Generation timings", format_timings(result)))
+        for warning in result["warnings"]:
+            channel.call(lambda m=warning: messagebox.showwarning("Warning", m))
+        if result["url"]:
+            channel.call(lambda: messagebox.showinfo(
+                "Success", 
+                f"🚀 Flask app for '{project_name}' is now running!\n\nURL: {result['url']}"
+            ))
+    except GenerationCancelled:
+        channel.publish(None, "🛑 Project creation cancelled", "orange")
     except Exception as e:
         error_msg = str(e)
-        show_error("Error", f"Project creation failed:\n{error_msg}")
-        app.after(0, lambda: status_label.configure(text=f"❌ Error: {error_msg}", text_color="red"))
-        app.after(0, lambda: create_btn.configure(state="normal", text="Create Project"))
-        app.after(3000, lambda: progress_bar.pack_forget())
+        channel.call(lambda: messagebox.showerror("Error", f"Project creation failed:\n{error_msg}"))
+        channel.publish(None, f"❌ Error: {error_msg}", "red")
+    finally:
+        channel.close()
+
+def resource_path(name):
+    """Path of a bundled file, both from source and inside the PyInstaller executable."""
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
+
+ICON_SIZE = (64, 64)
 
-def run_gui():
-    """Initialize and run the GUI application."""
+def load_header_icon():
+    """Load the 64x64 header icon as a Tk image.
+
+    The PyInstaller build ships a pre-rendered icon_64.png. Running from source,
+    icon.ico is decoded and resized with PIL once and the result cached as PNG,
+    so later launches need neither PIL nor the resize.
+    """
+    import tkinter
+    bundled = resource_path("icon_64.png")
+    if os.path.exists(bundled):
+        return tkinter.PhotoImage(file=bundled)
+    
+    ico_path = resource_path("icon.ico")
+    if not os.path.exists(ico_path):
+        return None
+    cached = os.path.join(CACHE_DIR, "icon_64.png")
+    if not os.path.exists(cached) or os.path.getmtime(cached) < os.path.getmtime(ico_path):
+        from PIL import Image
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        Image.open(ico_path).resize(ICON_SIZE, Image.LANCZOS).save(cached)
+    return tkinter.PhotoImage(file=cached)
+
+def report_startup_time(app):
+    """Print and record time-to-first-frame, then close the window."""
+    elapsed = time.perf_counter() - _STARTED
+    report = {"time_to_first_frame_ms": round(elapsed * 1000, 1), "frozen": getattr(sys, "frozen", False)}
+    print(json.dumps(report))
+    # The windowed executable has no console, so keep a copy on disk as well
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, "startup_time.json"), "w") as f:
+            json.dump(report, f)
+    except OSError:
+        pass
+    app.destroy()
+
+def run_gui(measure_startup=False):
+    """Initialize and run the GUI application.
+
+    With measure_startup, the window closes as soon as the first frame has been
+    drawn and the time since the script started is reported.
+    """
+    import customtkinter as ctk
+    
     # Set appearance mode and default color theme
     ctk.set_appearance_mode("System")  # or "Light" or "Dark"
     ctk.set_default_color_theme("blue")  # blue, green, dark-blue
@@ -329,20 +2839,16 @@ def run_gui():
     app.minsize(750, 600)  # Set minimum window size
     
     # Try to load icon
-    icon_path = "icon.ico"
-    icon_image = None
+    icon_photo = None
     try:
-        app.iconbitmap(icon_path)
-        # Also load the icon for display in the UI
-        if os.path.exists(icon_path):
-            try:
-                # For PIL/Pillow versions that support .ico directly
-                icon_image = Image.open(icon_path)
-            except:
-                # Fallback icon if we can't load the .ico
-                icon_image = None
+        app.iconbitmap(resource_path("icon.ico"))
     except:
         print("Icon not found, using default")
+    try:
+        # Also load the icon for display in the UI
+        icon_photo = load_header_icon()
+    except Exception:
+        icon_photo = None
     
     # Create a consistent padding and style
     padding = {"padx": 20, "pady": 10}
@@ -360,12 +2866,7 @@ def run_gui():
     logo_frame.pack(fill="x", padx=20, pady=15)
     
     # Add app icon if available
-    if icon_image:
-        # Resize icon for display
-        icon_size = (64, 64)
-        icon_image = icon_image.resize(icon_size, Image.LANCZOS)
-        icon_photo = ImageTk.PhotoImage(icon_image)
-        
+    if icon_photo:
         icon_label = ctk.CTkLabel(logo_frame, text="", image=icon_photo)
         icon_label.image = icon_photo  # Keep a reference to prevent garbage collection
         icon_label.pack(side="left", padx=(0, 15))
@@ -474,6 +2975,123 @@ def run_gui():
     # Add grid configuration to make resizing work properly
     input_frame.columnconfigure(1, weight=1)
     
+    # Generation options
+    options_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+    options_frame.pack(fill="x", padx=20, pady=(0, 10))
+    
+    pack_label = ctk.CTkLabel(options_frame, text="Template:", font=ctk.CTkFont(size=13))
+    pack_label.pack(side="left")
+    
+    pack_var = ctk.StringVar(value=DEFAULT_OPTIONS["template_pack"])
+    pack_menu = ctk.CTkOptionMenu(options_frame, values=list_template_packs(), variable=pack_var, width=140)
+    pack_menu.pack(side="left", padx=(10, 20))
+    
+    show_timings_var = ctk.BooleanVar(value=False)
+    timings_check = ctk.CTkCheckBox(
+        options_frame,
+        text="Show timing report",
+        variable=show_timings_var,
+        font=ctk.CTkFont(size=13)
+    )
+    timings_check.pack(side="left")
+    
+    # Optional extras scaffolded into the project
+    features_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+    features_frame.pack(fill="x", padx=20, pady=(0, 10))
+    
+    assets_var = ctk.BooleanVar(value=DEFAULT_OPTIONS["assets"])
+    assets_check = ctk.CTkCheckBox(
+        features_frame,
+        text="Build static assets",
+        variable=assets_var,
+        font=ctk.CTkFont(size=13)
+    )
+    assets_check.pack(side="left")
+    
+    bench_var = ctk.BooleanVar(value=DEFAULT_OPTIONS["bench"])
+    bench_check = ctk.CTkCheckBox(
+        features_frame,
+        text="Load-test harness",
+        variable=bench_var,
+        font=ctk.CTkFont(size=13)
+    )
+    bench_check.pack(side="left", padx=(20, 0))
+    
+    instrumentation_var = ctk.BooleanVar(value=DEFAULT_OPTIONS["instrumentation"])
+    instrumentation_check = ctk.CTkCheckBox(
+        features_frame,
+        text="Instrumentation",
+        variable=instrumentation_var,
+        font=ctk.CTkFont(size=13)
+    )
+    instrumentation_check.pack(side="left", padx=(20, 0))
+    
+    factory_var = ctk.BooleanVar(value=DEFAULT_OPTIONS["app_factory"])
+    factory_check = ctk.CTkCheckBox(
+        features_frame,
+        text="App factory + tests",
+        variable=factory_var,
+        font=ctk.CTkFont(size=13)
+    )
+    factory_check.pack(side="left", padx=(20, 0))
+    
+    json_api_var = ctk.BooleanVar(value=DEFAULT_OPTIONS["json_api"])
+    json_api_check = ctk.CTkCheckBox(
+        features_frame,
+        text="JSON API",
+        variable=json_api_var,
+        font=ctk.CTkFont(size=13)
+    )
+    json_api_check.pack(side="left", padx=(20, 0))
+    
+    # Follow the selected pack's default until the user picks another pack
+    def apply_pack_defaults(*_):
+        pack_options = load_template_pack(pack_var.get())["options"]
+        json_api_var.set(pack_options.get("json_api", DEFAULT_OPTIONS["json_api"]))
+    apply_pack_defaults()
+    pack_var.trace_add("write", apply_pack_defaults)
+    
+    # Production server profile
+    server_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+    server_frame.pack(fill="x", padx=20, pady=(0, 10))
+    
+    production_var = ctk.BooleanVar(value=DEFAULT_OPTIONS["server_profile"] == "production")
+    production_check = ctk.CTkCheckBox(
+        server_frame,
+        text="Production server (gunicorn)",
+        variable=production_var,
+        font=ctk.CTkFont(size=13)
+    )
+    production_check.pack(side="left")
+    
+    worker_label = ctk.CTkLabel(server_frame, text="Worker class:", font=ctk.CTkFont(size=13))
+    worker_label.pack(side="left", padx=(20, 0))
+    
+    worker_var = ctk.StringVar(value=DEFAULT_OPTIONS["worker_class"])
+    worker_menu = ctk.CTkOptionMenu(server_frame, values=GUNICORN_WORKER_CLASSES, variable=worker_var, width=110)
+    worker_menu.pack(side="left", padx=(10, 0))
+    
+    database_label = ctk.CTkLabel(server_frame, text="Database:", font=ctk.CTkFont(size=13))
+    database_label.pack(side="left", padx=(20, 0))
+    
+    database_var = ctk.StringVar(value=DEFAULT_OPTIONS["database"])
+    database_menu = ctk.CTkOptionMenu(server_frame, values=list(DATABASES), variable=database_var, width=120)
+    database_menu.pack(side="left", padx=(10, 0))
+    
+    def collect_options():
+        return {
+            "template_pack": pack_var.get(),
+            "server_profile": "production" if production_var.get() else "dev",
+            "worker_class": worker_var.get(),
+            "database": database_var.get(),
+            "assets": assets_var.get(),
+            "bench": bench_var.get(),
+            "instrumentation": instrumentation_var.get(),
+            "app_factory": factory_var.get(),
+            "json_api": json_api_var.get(),
+            "show_timings": show_timings_var.get()
+        }
+    
     # Separator
     separator2 = ctk.CTkFrame(content_frame, height=1, fg_color="gray75")
     separator2.pack(fill="x", padx=20, pady=10)
@@ -494,6 +3112,31 @@ def run_gui():
     progress_bar = ctk.CTkProgressBar(progress_frame)
     progress_bar.set(0)
     
+    # Collapsible pane with the output of git, venv and pip
+    log_box = ctk.CTkTextbox(progress_frame, height=140, font=ctk.CTkFont(family="Courier", size=11), wrap="none")
+    log_box.configure(state="disabled")
+    
+    def toggle_log():
+        if log_box.winfo_ismapped():
+            log_box.pack_forget()
+            log_toggle.configure(text="▸ Show output")
+        else:
+            log_box.pack(fill="x", pady=(5, 0))
+            log_toggle.configure(text="▾ Hide output")
+    
+    log_toggle = ctk.CTkButton(
+        progress_frame,
+        text="▸ Show output",
+        font=ctk.CTkFont(size=11),
+        width=100,
+        height=22,
+        fg_color="transparent",
+        text_color=("gray20", "gray80"),
+        hover_color=("gray85", "gray25"),
+        command=toggle_log
+    )
+    log_toggle.pack(side="bottom", anchor="w")
+    
     # Create button
     button_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
     button_frame.pack(fill="x", padx=20, pady=(10, 20))
@@ -506,14 +3149,27 @@ def run_gui():
         command=lambda: start_creation(
             project_entry.get(), 
             dir_entry.get(), 
+            collect_options(),
             progress_bar,
             status_label, 
+            log_box,
             create_btn, 
+            cancel_btn,
             app
         )
     )
     create_btn.pack(pady=10)
     
+    # Cancel button, only shown while a project is being created
+    cancel_btn = ctk.CTkButton(
+        button_frame,
+        text="Cancel",
+        font=ctk.CTkFont(size=13),
+        height=30,
+        fg_color="gray40",
+        hover_color="gray30"
+    )
+    
     # Footer with version and copyright
     footer_frame = ctk.CTkFrame(container, fg_color="transparent", height=30)
     footer_frame.pack(fill="x", pady=(10, 0))
@@ -543,7 +3199,124 @@ def run_gui():
     )
     mode_switch.pack(side="left", padx=10)
     
+    if measure_startup:
+        # <Map> fires when the window is shown; after_idle runs once it has been drawn
+        reported = []
+        
+        def on_first_map(event):
+            if event.widget is app and not reported:
+                reported.append(True)
+                app.after_idle(report_startup_time, app)
+        
+        app.bind("<Map>", on_first_map, add="+")
+    
     app.mainloop()
 
+def main(argv=None):
+    """Command-line entry point; starts the GUI when no command is given."""
+    parser = argparse.ArgumentParser(prog="flask_automator", description="Generate Flask projects.")
+    commands = parser.add_subparsers(dest="command")
+    
+    create_parser = commands.add_parser("create", help="generate a single project")
+    create_parser.add_argument("name", help="project name")
+    create_parser.add_argument("--path", default=os.getcwd(), help="directory to create the project in")
+    create_parser.add_argument("--no-git", action="store_true", help="skip git init")
+    create_parser.add_argument("--no-venv-cache", action="store_true", help="always build the venv from scratch")
+    create_parser.add_argument("--launch", action="store_true", help="start the dev server when done")
+    create_parser.add_argument("--pack", default=DEFAULT_OPTIONS["template_pack"], help="template pack to generate from")
+    create_parser.add_argument("--production", action="store_true", help="add gunicorn.conf.py and wsgi.py")
+    create_parser.add_argument(
+        "--worker-class", choices=GUNICORN_WORKER_CLASSES, default=DEFAULT_OPTIONS["worker_class"],
+        help="gunicorn worker class for --production"
+    )
+    create_parser.add_argument(
+        "--database", choices=list(DATABASES), default=DEFAULT_OPTIONS["database"],
+        help="database backend to configure"
+    )
+    create_parser.add_argument(
+        "--no-assets", action="store_true",
+        help="link Tailwind from the CDN instead of building purged, fingerprinted assets"
+    )
+    create_parser.add_argument("--no-bench", action="store_true", help="leave out the bench/ load generator")
+    create_parser.add_argument(
+        "--no-instrumentation", action="store_true",
+        help="leave out backend/instrumentation.py (timing, query counting and profiling)"
+    )
+    create_parser.add_argument(
+        "--app-factory", action="store_true",
+        help="generate a create_app() factory with a session-scoped pytest fixture"
+    )
+    create_parser.add_argument(
+        "--json-api", action=argparse.BooleanOptionalAction, default=None,
+        help="orjson provider, keyset pagination and NDJSON streaming (default: on for the api pack)"
+    )
+    create_parser.add_argument(
+        "--no-reloader", action="store_true",
+        help="keep Werkzeug's polling reloader in run.py instead of the watchdog one"
+    )
+    create_parser.add_argument("-v", "--verbose", action="store_true", help="print the output of git, venv and pip")
+    
+    batch_parser = commands.add_parser("batch", help="generate every project in a JSON manifest")
+    batch_parser.add_argument("manifest", help="JSON list of {name, path, options} entries")
+    batch_parser.add_argument("--path", help="default directory for entries without a path")
+    batch_parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    
+    commands.add_parser("packs", help="list the available template packs")
+    
+    parser.add_argument("--startup-time", action="store_true", help="open the GUI, report time-to-first-frame and exit")
+    
+    args = parser.parse_args(argv)
+    if args.command is None:
+        run_gui(measure_startup=args.startup_time)
+        return 0
+    
+    if args.command == "packs":
+        for name in list_template_packs():
+            print(f"{name:15} {load_template_pack(name)['description']}")
+        return 0
+    
+    if args.command == "create":
+        options = {
+            "git": not args.no_git,
+            "venv_cache": not args.no_venv_cache,
+            "launch": args.launch,
+            "template_pack": args.pack,
+            "server_profile": "production" if args.production else "dev",
+            "worker_class": args.worker_class,
+            "database": args.database,
+            "assets": not args.no_assets,
+            "bench": not args.no_bench,
+            "instrumentation": not args.no_instrumentation,
+            "app_factory": args.app_factory,
+            "reloader": not args.no_reloader
+        }
+        if args.json_api is not None:
+            options["json_api"] = args.json_api
+        try:
+            result = generate_project(
+                args.name, args.path, options,
+                lambda percent, message, color="grey": print(f"{percent:5.1f}% {message}", flush=True),
+                log_callback=(lambda line: print(f"    {line}", flush=True)) if args.verbose else None
+            )
+        except Exception as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        for warning in result["warnings"]:
+            print(f"⚠️ {warning}", file=sys.stderr)
+        print(result["project_path"])
+        return 0
+    
+    entries = load_manifest(args.manifest, args.path)
+    failed = 0
+    for entry, result, error in generate_batch(entries, args.workers):
+        if error:
+            failed += 1
+            print(f"❌ {entry['name']}: {error}", file=sys.stderr)
+        else:
+            print(f"✅ {entry['name']}: {result['project_path']}")
+            for warning in result["warnings"]:
+                print(f"⚠️ {entry['name']}: {warning}", file=sys.stderr)
+    return 1 if failed else 0
+
 if __name__ == "__main__":
-    run_gui()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
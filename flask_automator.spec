@@ -1,11 +1,18 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+from PIL import Image
+
+# Pre-render the 64x64 header icon so the app never decodes and resizes icon.ico at startup
+header_icon = os.path.join(workpath, 'icon_64.png')
+os.makedirs(workpath, exist_ok=True)
+Image.open('icon.ico').resize((64, 64), Image.LANCZOS).save(header_icon)
 
 
 a = Analysis(
     ['flask_automator.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('icon.ico', '.'), (header_icon, '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
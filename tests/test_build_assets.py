@@ -0,0 +1,50 @@
+import runpy
+
+import pytest
+
+from flask_automator import TEMPLATES, compile_template
+
+
+@pytest.fixture(scope="module")
+def build(tmp_path_factory):
+    """The namespace of the tools/build_assets.py script generated projects get."""
+    script = tmp_path_factory.mktemp("tools") / "build_assets.py"
+    script.write_text(compile_template(TEMPLATES["build_assets_py"]).safe_substitute({}))
+    return runpy.run_path(str(script))
+
+
+def test_parse_blocks_splits_rules_statements_and_nested_blocks(build):
+    css = '@import "a.css";.a{color:red}@media (min-width:640px){.b{color:blue}}'
+    assert build["parse_blocks"](css) == [
+        ('@import "a.css"', None),
+        (".a", "color:red"),
+        ("@media (min-width:640px)", ".b{color:blue}"),
+    ]
+
+
+def test_parse_blocks_ignores_braces_in_strings(build):
+    css = '.a::before{content:"}"}.b{color:red}'
+    assert [prelude for prelude, _ in build["parse_blocks"](css)] == [".a::before", ".b"]
+
+
+def test_purge_keeps_only_rules_whose_classes_are_used(build):
+    css = ".used{a:1}.unused{b:2}.used .unused{c:3}p{d:4}"
+    assert build["purge"](css, {"used"}) == ".used{a:1}p{d:4}"
+
+
+def test_purge_filters_selector_lists(build):
+    assert build["purge"](".a,.b{x:1}", {"b"}) == ".b{x:1}"
+
+
+def test_purge_recurses_into_media_and_drops_empty_ones(build):
+    css = "@media (min-width:640px){.sm\\:flex{display:flex}}@media print{.gone{x:1}}"
+    assert build["purge"](css, {"sm:flex"}) == "@media (min-width:640px){.sm\\:flex{display:flex}}"
+
+
+def test_purge_keeps_other_at_rules(build):
+    css = "@keyframes spin{to{transform:rotate(360deg)}}"
+    assert build["purge"](css, set()) == css
+
+
+def test_unescape_handles_hex_and_character_escapes(build):
+    assert build["unescape"]("\\32xl\\:p-4") == "2xl:p-4"
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+import flask_automator
+from flask_automator import GENERATION_MANIFEST, generate_project, generated_file_action, read_generation_manifest
+
+JOBS = os.path.join("backend", "jobs", "__init__.py")
+DATABASE = os.path.join("backend", "database.py")
+
+
+@pytest.mark.parametrize("new, old, disk, action", [
+    ("t1", None, None, "write"),           # new file
+    ("t1", "t1", "t1", "unchanged"),
+    ("t2", "t1", "t1", "write"),           # template changed, file untouched
+    ("t1", "t1", "edit", "kept"),          # edited, template unchanged
+    ("t2", "t1", "edit", "kept_changed"),  # edited and the template changed
+    ("t1", None, "edit", "kept_changed"),  # not generated by us
+    ("t1", "t1", None, "kept"),            # deleted, template unchanged
+    ("t2", "t1", None, "write"),           # deleted, template changed
+])
+def test_generated_file_action(new, old, disk, action):
+    assert generated_file_action(new, old, disk) == action
+
+
+@pytest.fixture()
+def project(tmp_path, monkeypatch):
+    """An existing worker project whose venv is current, so only scaffolding runs."""
+    monkeypatch.setattr(flask_automator, "dependency_hash", lambda python_cmd, dependencies: "deps")
+    path = tmp_path / "svc"
+    python_path = flask_automator.venv_executables(str(path / "venv"))[1]
+    os.makedirs(os.path.dirname(python_path))
+    open(python_path, "w").close()
+    flask_automator.write_generation_manifest(str(path), {"files": {}, "dependency_hash": "deps"})
+    return path
+
+
+def generate(project):
+    return generate_project(project.name, str(project.parent), {"template_pack": "worker", "git": False})
+
+
+def test_first_run_writes_and_records_every_file(project):
+    result = generate(project)
+    assert JOBS in result["files"]["written"]
+    recorded = read_generation_manifest(str(project))["files"]
+    assert recorded[JOBS] == flask_automator.file_hash(project / JOBS)
+
+
+def test_rerun_without_changes_writes_nothing(project):
+    generate(project)
+    result = generate(project)
+    assert result["files"]["written"] == []
+    assert JOBS in result["files"]["unchanged"]
+
+
+def test_edited_file_is_kept_silently_when_the_template_is_unchanged(project):
+    generate(project)
+    (project / JOBS).write_text("# mine\n")
+    result = generate(project)
+    assert (project / JOBS).read_text() == "# mine\n"
+    assert JOBS in result["files"]["kept"]
+    assert result["warnings"] == []
+
+
+def test_edited_file_is_kept_with_a_warning_when_the_template_changed(project, monkeypatch):
+    generate(project)
+    (project / DATABASE).write_text("# mine\n")
+    monkeypatch.setitem(flask_automator.TEMPLATES, "database_sqlite_py", "# new template\n")
+    result = generate(project)
+    assert (project / DATABASE).read_text() == "# mine\n"
+    assert any(DATABASE in warning for warning in result["warnings"])
+    # Still recorded with the hash it was generated with, so the edit stays detectable
+    recorded = read_generation_manifest(str(project))["files"]
+    assert recorded[DATABASE] != flask_automator.file_hash(project / DATABASE)
+
+
+def test_untouched_file_is_rewritten_when_the_template_changed(project, monkeypatch):
+    generate(project)
+    monkeypatch.setitem(flask_automator.TEMPLATES, "database_sqlite_py", "# new template\n")
+    result = generate(project)
+    assert DATABASE in result["files"]["written"]
+    assert (project / DATABASE).read_bytes() == "# new template\n".replace("\n", os.linesep).encode()
+
+
+def test_deleted_file_stays_deleted_until_the_template_changes(project, monkeypatch):
+    generate(project)
+    os.remove(project / DATABASE)
+    generate(project)
+    assert not (project / DATABASE).exists()
+    monkeypatch.setitem(flask_automator.TEMPLATES, "database_sqlite_py", "# new template\n")
+    generate(project)
+    assert (project / DATABASE).exists()
+
+
+def test_step_outputs_are_not_overwritten_by_scaffolding(project):
+    generate(project)
+    (project / "requirements.txt").write_text("flask==3.0.0\n")
+    generate(project)
+    assert (project / "requirements.txt").read_text() == "flask==3.0.0\n"
+
+
+def test_manifest_lives_in_the_project(project):
+    generate(project)
+    assert (project / GENERATION_MANIFEST).is_file()
@@ -0,0 +1,36 @@
+import hashlib
+import pathlib
+
+from flask_automator import format_lockfile, format_pins, packages_from_report
+
+
+def report_item(wheel, name, version):
+    return {
+        "download_info": {"url": pathlib.Path(wheel).as_uri()},
+        "metadata": {"name": name, "version": version},
+    }
+
+
+def test_packages_from_report_hashes_the_wheelhouse_files(tmp_path):
+    flask_wheel = tmp_path / "flask-3.1.0-py3-none-any.whl"
+    flask_wheel.write_bytes(b"flask")
+    blinker_wheel = tmp_path / "blinker-1.9.0-py3-none-any.whl"
+    blinker_wheel.write_bytes(b"blinker")
+    report = {"install": [
+        report_item(flask_wheel, "Flask", "3.1.0"),
+        report_item(blinker_wheel, "blinker", "1.9.0"),
+    ]}
+    packages = packages_from_report(report)
+    assert [package["name"] for package in packages] == ["blinker", "Flask"]
+    assert packages[1] == {
+        "name": "Flask",
+        "version": "3.1.0",
+        "file": flask_wheel.name,
+        "sha256": hashlib.sha256(b"flask").hexdigest(),
+    }
+
+
+def test_lockfile_carries_hashes_and_pins_do_not():
+    packages = [{"name": "Flask", "version": "3.1.0", "file": "flask.whl", "sha256": "ab" * 32}]
+    assert f"Flask==3.1.0 \\\n    --hash=sha256:{'ab' * 32}" in format_lockfile(packages)
+    assert format_pins(packages) == "Flask==3.1.0\n"
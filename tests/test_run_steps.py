@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from flask_automator import GenerationCancelled, run_steps
+
+
+def recorder(log, name, delay=0.0):
+    def run(report):
+        log.append(("start", name))
+        time.sleep(delay)
+        report(1.0, f"{name} done")
+        log.append(("end", name))
+    return run
+
+
+def test_steps_start_after_their_dependencies():
+    log = []
+    steps = [
+        {"name": "a", "run": recorder(log, "a", 0.02)},
+        {"name": "b", "run": recorder(log, "b"), "after": ["a"]},
+        {"name": "c", "run": recorder(log, "c"), "after": ["a", "b"]},
+    ]
+    run_steps(steps)
+    assert log.index(("end", "a")) < log.index(("start", "b"))
+    assert log.index(("end", "b")) < log.index(("start", "c"))
+
+
+def test_independent_steps_overlap():
+    both_running = threading.Barrier(2, timeout=2)
+    steps = [
+        {"name": "a", "run": lambda report: both_running.wait()},
+        {"name": "b", "run": lambda report: both_running.wait()},
+    ]
+    # Deadlocks (and the barrier times out) if the steps run one after the other
+    run_steps(steps)
+
+
+def test_unknown_dependencies_are_ignored():
+    log = []
+    run_steps([{"name": "a", "run": recorder(log, "a"), "after": ["not-scheduled"]}])
+    assert log == [("start", "a"), ("end", "a")]
+
+
+def test_critical_path_follows_the_last_finishing_dependency():
+    log = []
+    steps = [
+        {"name": "fast", "run": recorder(log, "fast")},
+        {"name": "slow", "run": recorder(log, "slow", 0.05)},
+        {"name": "join", "run": recorder(log, "join"), "after": ["fast", "slow"]},
+    ]
+    schedule = run_steps(steps)
+    assert schedule["critical_path"] == ["slow", "join"]
+    assert set(schedule["durations"]) == {"fast", "slow", "join"}
+    assert schedule["elapsed"] >= schedule["durations"]["slow"]
+
+
+def test_progress_is_weighted_and_reaches_100():
+    reported = []
+    steps = [
+        {"name": "a", "run": lambda report: report(0.5, "half"), "weight": 3},
+        {"name": "b", "run": lambda report: report(1.0, "done"), "weight": 1, "after": ["a"]},
+    ]
+    run_steps(steps, lambda percent, message, color="grey": reported.append(percent))
+    assert reported[0] == pytest.approx(100 * 0.5 * 3 / 4)
+    assert reported[-1] == pytest.approx(100)
+
+
+def test_failure_stops_new_steps_and_raises_the_error():
+    log = []
+
+    def fail(report):
+        raise ValueError("boom")
+
+    steps = [
+        {"name": "a", "run": fail},
+        {"name": "b", "run": recorder(log, "b"), "after": ["a"]},
+    ]
+    with pytest.raises(ValueError, match="boom"):
+        run_steps(steps)
+    assert log == []
+
+
+def test_cancel_stops_running_and_pending_steps():
+    cancel = threading.Event()
+    log = []
+
+    def long_step(report):
+        cancel.set()
+        for _ in range(100):
+            report(0.1, "working")
+            time.sleep(0.01)
+
+    steps = [
+        {"name": "a", "run": long_step},
+        {"name": "b", "run": recorder(log, "b"), "after": ["a"]},
+    ]
+    started = time.perf_counter()
+    with pytest.raises(GenerationCancelled):
+        run_steps(steps, cancel_event=cancel)
+    assert time.perf_counter() - started < 0.5
+    assert log == []
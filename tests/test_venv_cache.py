@@ -0,0 +1,65 @@
+import os
+import stat
+
+import pytest
+
+from flask_automator import clone_tree, make_read_only, relocate_venv, venv_executables
+
+SCRIPTS = "Scripts" if os.name == "nt" else "bin"
+
+
+def fake_venv(path):
+    os.makedirs(path / SCRIPTS)
+    os.makedirs(path / "lib" / "site-packages" / "flask")
+    (path / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = python -m venv {path}\n")
+    (path / SCRIPTS / "activate").write_text(f'VIRTUAL_ENV="{path}"\n')
+    (path / SCRIPTS / "pip").write_text(f"#!{venv_executables(str(path))[1]}\nimport pip\n")
+    (path / "lib" / "site-packages" / "flask" / "app.py").write_text("# flask\n")
+    return path
+
+
+def test_relocate_rewrites_prefixes_in_scripts_and_config(tmp_path):
+    old = fake_venv(tmp_path / "old")
+    new = tmp_path / "new"
+    os.rename(old, new)
+    relocate_venv(str(new), str(old), str(new))
+    for name in ("activate", "pip"):
+        text = (new / SCRIPTS / name).read_text()
+        assert str(new) in text and str(old) + os.sep not in text
+    assert f"venv {new}" in (new / "pyvenv.cfg").read_text()
+
+
+def test_relocate_replaces_files_instead_of_editing_hardlinks(tmp_path):
+    cached = fake_venv(tmp_path / "cached")
+    project = tmp_path / "project"
+    clone_tree(str(cached), str(project))
+    relocate_venv(str(project), str(cached), str(project))
+    assert str(cached) in (cached / SCRIPTS / "activate").read_text()
+
+
+def test_clone_without_hardlinks_shares_no_inodes(tmp_path):
+    source = fake_venv(tmp_path / "source")
+    target = tmp_path / "target"
+    clone_tree(str(source), str(target), hardlink=False)
+    app = os.path.join("lib", "site-packages", "flask", "app.py")
+    assert not os.path.samefile(source / app, target / app)
+    (target / app).write_text("# edited\n")
+    assert (source / app).read_text() == "# flask\n"
+
+
+def test_read_only_tree_clones_into_writable_copies(tmp_path):
+    source = fake_venv(tmp_path / "source")
+    make_read_only(str(source))
+    app = os.path.join("lib", "site-packages", "flask", "app.py")
+    assert not os.stat(source / app).st_mode & stat.S_IWUSR
+    target = tmp_path / "target"
+    clone_tree(str(source), str(target), hardlink=False)
+    assert os.stat(target / app).st_mode & stat.S_IWUSR
+
+
+@pytest.mark.skipif(os.name == "nt", reason="directory permissions work differently on Windows")
+def test_read_only_tree_keeps_directories_writable(tmp_path):
+    source = fake_venv(tmp_path / "source")
+    make_read_only(str(source))
+    # New files (e.g. __pycache__ entries) can still be created next to read-only ones
+    (source / "lib" / "site-packages" / "flask" / "new.py").write_text("")